@@ -0,0 +1,114 @@
+# Skalierungs-Benchmark für die Modelle auf synthetischen Instanzen (instance_generator.py).
+# Je Instanz und Formulierung werden Aufbauzeit, Modellgröße, Presolve- und Lösungszeit, Verlauf des MIP-Gaps
+# und der Speicherbedarf erfasst und an benchmark_results.csv / benchmark_results.json angehängt,
+# sodass Regressionen über mehrere Läufe hinweg verglichen werden können.
+import csv
+import datetime
+import json
+import os
+import resource
+import time
+
+import gurobipy as gp
+
+from dispatching import dispatch, warm_start
+from disjunctive_model import build_disjunctive_model, warm_start_disjunctive
+from instance_generator import random_instance, taillard_instance
+from matrix_model import build_model_matrix
+from optimization_algorithm import planning_horizon
+from profiling import gap_trace, start_telemetry, telemetry_callback
+
+# (Name, Generator, Parameter, Horizont); Horizont None = aus der Listenplanung (planning_horizon)
+benchmark_cases = [
+    ("random_5x4x2", random_instance, {"n_jobs": 5, "n_machines": 4, "n_technologies": 2}, None),
+    ("random_10x6x3", random_instance, {"n_jobs": 10, "n_machines": 6, "n_technologies": 3}, None),
+    ("random_20x8x4", random_instance, {"n_jobs": 20, "n_machines": 8, "n_technologies": 4}, None),
+    ("random_50x12x4", random_instance, {"n_jobs": 50, "n_machines": 12, "n_technologies": 4}, None),
+    ("random_10x6x3_h200", random_instance, {"n_jobs": 10, "n_machines": 6, "n_technologies": 3}, 200),
+    ("taillard_5x4", taillard_instance, {"n_jobs": 5, "n_machines": 4, "duration_range": (1, 9)}, None),
+    ("taillard_10x6x3", taillard_instance, {"n_jobs": 10, "n_machines": 6, "n_technologies": 3, "duration_range": (1, 9)}, None),
+    ("taillard_15x15", taillard_instance, {"n_jobs": 15, "n_machines": 15}, None),
+]
+formulations = ("time_indexed", "disjunctive")
+time_limit = 60
+results_file = "benchmark_results"
+
+# Spalten der CSV-Datei (der Gap-Verlauf steht nur in der JSON-Datei)
+csv_columns = ["timestamp", "case", "formulation", "jobs", "machines", "technologies", "operations", "horizon",
+               "build_time", "variables", "constraints", "nonzeros", "presolve_time", "solve_time",
+               "status", "objective", "bound", "gap", "gurobi_peak_mb", "process_peak_mb", "error"]
+
+
+def run_case(name, instance, formulation, horizon=None, time_limit=time_limit):
+    time_period = range(horizon) if horizon else planning_horizon(instance)
+    record = {"timestamp": datetime.datetime.now().isoformat(timespec="seconds"), "case": name, "formulation": formulation,
+              "jobs": len(instance["jobs"]), "machines": len(instance["machines"]),
+              "technologies": len(instance["technologies"]),
+              "operations": sum(len(steps) for steps in instance["job_process_order"].values()),
+              "horizon": len(time_period), "gap_trace": []}
+    try:
+        start = time.perf_counter()
+        if formulation == "disjunctive":
+            model, variables = build_disjunctive_model(instance, time_period)
+        else:
+            model, x, _ = build_model_matrix(instance, time_period)
+        model.update()
+        record["build_time"] = time.perf_counter() - start
+        record.update(variables=model.NumVars, constraints=model.NumConstrs, nonzeros=model.NumNZs)
+
+        initial_schedule = dispatch(instance)
+        if formulation == "disjunctive":
+            warm_start_disjunctive(model, variables, initial_schedule)
+        else:
+            warm_start(model, x, initial_schedule)
+
+        model.Params.TimeLimit = time_limit
+        start_telemetry(model)
+        model.optimize(telemetry_callback)
+
+        record.update(gap_trace=gap_trace(model._records), presolve_time=model._presolve_end, solve_time=model.Runtime, status=model.Status,
+                      objective=model.ObjVal if model.SolCount > 0 else None, bound=model.ObjBound,
+                      gap=model.MIPGap if model.SolCount > 0 else None, gurobi_peak_mb=model.MaxMemUsed*1024)
+        model.dispose()
+    except gp.GurobiError as e:
+        record["error"] = str(e)
+    # ru_maxrss ist unter Linux in KiB angegeben
+    record["process_peak_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss/1024
+    return record
+
+
+# Ergebnisse an die CSV- und JSON-Datei anhängen
+def write_results(records, results_file=results_file):
+    csv_path = f"{results_file}.csv"
+    new_file = not os.path.exists(csv_path)
+    with open(csv_path, "a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=csv_columns, extrasaction="ignore")
+        if new_file:
+            writer.writeheader()
+        writer.writerows(records)
+
+    json_path = f"{results_file}.json"
+    previous = []
+    if os.path.exists(json_path):
+        with open(json_path) as f:
+            previous = json.load(f)
+    with open(json_path, "w") as f:
+        json.dump(previous + records, f, indent=1)
+
+
+def run_benchmark(cases=benchmark_cases, formulations=formulations, time_limit=time_limit, results_file=results_file):
+    records = []
+    for name, generator, parameters, horizon in cases:
+        instance = generator(**parameters)
+        for formulation in formulations:
+            record = run_case(name, instance, formulation, horizon, time_limit)
+            print(f"{name:20s} {formulation:13s} Aufbau {record.get('build_time', 0):7.3f}s  "
+                  f"Lösung {record.get('solve_time') or 0:7.2f}s  Gap {record.get('gap')}  {record.get('error', '')}")
+            records.append(record)
+    write_results(records, results_file)
+    return records
+
+
+if __name__ == "__main__":
+    gp.setParam("OutputFlag", 0)
+    run_benchmark()
@@ -0,0 +1,76 @@
+# Vergleich der Formulierungen des zeitindizierten Modells (build_model_matrix):
+# Kapazität je Maschine und Periode ("period") bzw. zusätzlich je Job und Periode ("clique"),
+# Maschinenfolge als eine Summenzeile je Arbeitsgang ("aggregated") bzw. je Periode ("disaggregated").
+# Erfasst werden die Schranke der LP-Relaxation, die Schranke am Ende des Wurzelknotens (nach Schnittebenen),
+# die Anzahl der Knoten und die Zeit bis zum Optimalitätsnachweis.
+import itertools
+
+import gurobipy as gp
+from gurobipy import GRB
+import tabulate
+
+from dispatching import dispatch, warm_start
+from instance_generator import random_instance, taillard_instance
+from matrix_model import build_model_matrix
+from optimization_algorithm import instance, planning_horizon
+
+variants = list(itertools.product(("period", "clique"), ("aggregated", "disaggregated")))
+benchmark_cases = [
+    ("Beispiel", lambda: instance),
+    ("random_10x6x3", lambda: random_instance(10, 6, 3, seed=2)),
+    ("random_20x8x4", lambda: random_instance(20, 8, 4)),
+    ("taillard_5x4", lambda: taillard_instance(5, 4, duration_range=(1, 9))),
+    ("taillard_10x6x3", lambda: taillard_instance(10, 6, 3, duration_range=(1, 9))),
+]
+
+
+# Callback: Schranke, solange noch der Wurzelknoten bearbeitet wird
+def root_bound_callback(model, where):
+    if where == GRB.Callback.MIP and model.cbGet(GRB.Callback.MIP_NODCNT) == 0:
+        model._root_bound = model.cbGet(GRB.Callback.MIP_OBJBND)
+
+
+def run_variant(instance, time_period, capacity, precedence, time_limit=60):
+    model, x, _ = build_model_matrix(instance, time_period, capacity=capacity, precedence=precedence)
+    model.update()
+    relaxation = model.relax()
+    relaxation.optimize()
+    lp_bound = relaxation.ObjVal
+    relaxation.dispose()
+
+    warm_start(model, x, dispatch(instance))
+    model.Params.TimeLimit = time_limit
+    model._root_bound = None
+    model.optimize(root_bound_callback)
+    result = {"Nebenbed.": model.NumConstrs, "Nichtnullen": model.NumNZs, "LP-Schranke": lp_bound,
+              "Wurzelschranke": model._root_bound if model._root_bound is not None else model.ObjBound,
+              "Knoten": int(model.NodeCount), "Zeit bis optimal [s]": model.Runtime if model.Status == GRB.OPTIMAL else None,
+              "Ziel": model.ObjVal if model.SolCount > 0 else None, "Gap": model.MIPGap if model.SolCount > 0 else None}
+    model.dispose()
+    return result
+
+
+def benchmark_capacity(cases=benchmark_cases, variants=variants, time_limit=60):
+    rows = []
+    for name, make_instance in cases:
+        case = make_instance()
+        time_period = planning_horizon(case)
+        for capacity, precedence in variants:
+            try:
+                result = run_variant(case, time_period, capacity, precedence, time_limit)
+            except gp.GurobiError as e:
+                result = {"Ziel": f"Fehler {e.errno}"}
+            rows.append({"Instanz": name, "Horizont": len(time_period), "Kapazität": capacity, "Folge": precedence, **result})
+    return rows
+
+
+def print_benchmark(rows):
+    headers = ["Instanz", "Horizont", "Kapazität", "Folge", "Nebenbed.", "Nichtnullen", "LP-Schranke", "Wurzelschranke",
+               "Knoten", "Zeit bis optimal [s]", "Ziel", "Gap"]
+    print(tabulate.tabulate([[row.get(header) for header in headers] for row in rows], headers=headers,
+                            tablefmt="grid", floatfmt=".2f"))
+
+
+if __name__ == "__main__":
+    gp.setParam("OutputFlag", 0)
+    print_benchmark(benchmark_capacity())
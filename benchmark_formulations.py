@@ -0,0 +1,76 @@
+# Vergleich zeitindiziertes vs. disjunktives Modell auf derselben Instanz.
+# Variiert werden die Anzahl der Jobs (Vervielfachung der Beispieldaten) und die Länge der Bearbeitungszeiten.
+# Längere Bearbeitungszeiten verlängern den Horizont und vergrößern nur das zeitindizierte Modell,
+# mehr Jobs je Maschine vergrößern vor allem das disjunktive Modell (Reihenfolgepaare).
+import time
+
+import gurobipy as gp
+from gurobipy import GRB
+import tabulate
+
+from matrix_model import replicate_jobs
+from optimization_algorithm import instance, solve
+
+formulations = ("time_indexed", "disjunctive")
+
+
+# Alle Bearbeitungszeiten mit einem Faktor multiplizieren (entspricht einem feineren Zeitraster)
+def scale_durations(instance, factor):
+    scaled = dict(instance)
+    scaled["job_process_order"] = {j: [(tech, duration*factor) for tech, duration in steps]
+                                   for j, steps in instance["job_process_order"].items()}
+    return scaled
+
+
+def benchmark_formulations(instance, job_factors=(1, 2), duration_factors=(1, 4, 16), time_limit=30):
+    results = []
+    for job_factor in job_factors:
+        for duration_factor in duration_factors:
+            scenario = scale_durations(replicate_jobs(instance, job_factor), duration_factor)
+            row = {"Jobs": len(scenario["jobs"]), "Zeitfaktor": duration_factor}
+            for formulation in formulations:
+                start = time.perf_counter()
+                try:
+                    model, schedule = solve(scenario, formulation, time_limit=time_limit)
+                except gp.GurobiError as e:
+                    row[formulation] = f"Fehler {e.errno}"
+                    continue
+                row[formulation] = {"Variablen": model.NumVars,
+                                    "Nebenbed.": model.NumConstrs,
+                                    "Gesamt [s]": time.perf_counter() - start,
+                                    "Optimierung [s]": model.Runtime,
+                                    "Ziel": model.ObjVal if schedule is not None else None,
+                                    "Gap": model.MIPGap if schedule is not None else None,
+                                    "Optimal": model.Status == GRB.OPTIMAL}
+                model.dispose()
+            results.append(row)
+    return results
+
+
+# Ergebnisse als Tabelle ausgeben; "Vorteil" nennt das Modell, das schneller optimal war
+# bzw. bei Zeitlimit die bessere Lösung hatte
+def print_benchmark(results):
+    table = []
+    for row in results:
+        line = [row["Jobs"], row["Zeitfaktor"]]
+        ranking = []
+        for formulation in formulations:
+            result = row[formulation]
+            if isinstance(result, str):
+                line += [result, "", "", ""]
+                continue
+            line += [f"{result['Variablen']}/{result['Nebenbed.']}", result["Gesamt [s]"], result["Ziel"], result["Gap"]]
+            if result["Ziel"] is not None:
+                ranking.append((not result["Optimal"], result["Ziel"], result["Gesamt [s]"], formulation))
+        line.append(min(ranking)[3] if ranking else "-")
+        table.append(line)
+    headers = ["Jobs", "Zeitfaktor"]
+    for formulation in formulations:
+        headers += [f"{formulation} Var./NB", "Zeit [s]", "Ziel", "Gap"]
+    headers.append("Vorteil")
+    print(tabulate.tabulate(table, headers=headers, tablefmt="grid", floatfmt=".3f"))
+
+
+if __name__ == "__main__":
+    gp.setParam("OutputFlag", 0)
+    print_benchmark(benchmark_formulations(instance))
@@ -0,0 +1,112 @@
+# Disjunktives Modell (Reihenfolgemodell) als Alternative zum zeitindizierten Modell.
+# Statt einer Binärvariablen je Startperiode gibt es je Prozessschritt eine ganzzahlige Startzeit S (gleiches
+# Zeitraster wie das zeitindizierte Modell),
+# Zuordnungsvariablen y zu den Maschinen und je Paar von Schritten, die sich eine Maschine teilen können,
+# eine Reihenfolgevariable z. Die Modellgröße hängt damit nicht von der Länge des Horizonts ab,
+# wächst aber quadratisch mit der Anzahl der Schritte je Maschine.
+import itertools
+
+import gurobipy as gp
+from gurobipy import GRB
+
+from dispatching import makespan
+from time_indexed_model import operation_table
+
+
+# Arbeitsgänge mit Zeitfenster aus der Eignungstabelle: (j, step) -> (tech, Dauer, frühester Start, spätester Start)
+def operation_windows(instance, time_period):
+    table = operation_table(instance, time_period)
+    return {(j, step): (tech, duration, earliest, latest)
+            for j, step, tech, duration, earliest, latest in zip(*(table[column].tolist() for column in
+                                                                   ("job", "step", "technology", "duration", "earliest", "latest")))}
+
+
+def build_disjunctive_model(instance, time_period, weights=(1, 1, 1)):
+    technology_allocation = instance["technology_allocation"]
+    machine_energy_consumption = instance["machine_energy_consumption"]
+
+    operations = operation_windows(instance, time_period)
+
+    model = gp.Model("JobSchedulingDisjunctive")
+
+    # Ganzzahlige Startzeit je Prozessschritt, begrenzt durch Vorgänger- und Nachfolgerkette
+    S = model.addVars(operations.keys(), lb={o: w[2] for o, w in operations.items()},
+                      ub={o: w[3] for o, w in operations.items()}, vtype=GRB.INTEGER, name="S")
+    # Zuordnung der Prozessschritte zu Maschinen
+    y = model.addVars([(j, idx, m) for (j, idx), (tech, _, _, _) in operations.items() for m in technology_allocation[tech]],
+                      vtype=GRB.BINARY, name="y")
+    Cmax = model.addVar(vtype=GRB.INTEGER, name="Cmax")
+
+    # (1) Jeder Prozessschritt wird genau einer Maschine zugeordnet
+    for j, idx in operations:
+        model.addConstr(y.sum(j, idx, "*") == 1, name=f"assign_{j}_{idx}")
+
+    # (2) Zwei Schritte verschiedener Jobs auf derselben Maschine dürfen sich nicht überlappen.
+    # z[a, b] = 1 bedeutet: a vor b. Das Big-M ergibt sich aus den Zeitfenstern beider Schritte.
+    operations_on = {m: [o for o, (tech, _, _, _) in operations.items() if m in technology_allocation[tech]]
+                     for m in instance["machines"]}
+    pairs = {(a, b) for ops in operations_on.values() for a, b in itertools.combinations(ops, 2) if a[0] != b[0]}
+    z = model.addVars(pairs, vtype=GRB.BINARY, name="z")
+    for m, ops in operations_on.items():
+        for a, b in itertools.combinations(ops, 2):
+            if a[0] == b[0]:
+                continue
+            _, duration_a, release_a, latest_a = operations[a]
+            _, duration_b, release_b, latest_b = operations[b]
+            both_on_m = 2 - y[a + (m,)] - y[b + (m,)]
+            # Können sich die Zeitfenster nicht überlappen, wäre das Big-M negativ und würde die Zeile auch für
+            # Maschinen verschärfen, auf denen die Schritte gar nicht liegen; die Zeile gilt dann ohnehin (M = 0)
+            M_ab = max(0, latest_a + duration_a - release_b)
+            M_ba = max(0, latest_b + duration_b - release_a)
+            model.addConstr(S[a] + duration_a <= S[b] + M_ab*(1 - z[a, b]) + M_ab*both_on_m, name=f"disjunct_{m}_{a}_{b}")
+            model.addConstr(S[b] + duration_b <= S[a] + M_ba*z[a, b] + M_ba*both_on_m, name=f"disjunct_{m}_{b}_{a}")
+
+    # Maschinen, die erst ab instance["machine_available"][m] frei sind
+    for (j, idx, m), var in y.items():
+        if instance.get("machine_available", {}).get(m, 0) > 0:
+            model.addConstr(S[j, idx] >= instance["machine_available"][m]*var, name=f"available_{j}_{idx}_{m}")
+
+    # (3) Maschinenfolge der Jobs einhalten
+    for (j, idx), (_, duration, _, _) in operations.items():
+        if (j, idx + 1) in operations:
+            model.addConstr(S[j, idx] + duration <= S[j, idx + 1], name=f"sequence_{j}_{idx + 1}")
+
+    # (7) Cmax
+    for o, (_, duration, _, _) in operations.items():
+        model.addConstr(S[o] + duration <= Cmax, name=f"cmax_{o[0]}_{o[1]}")
+
+    # Zielfunktion wie im zeitindizierten Modell: gewichtete Summe aus Cmax, energy_consumed und Jmax (Summe der Endzeiten)
+    energy_consumed = gp.quicksum(machine_energy_consumption[m]*var for (_, _, m), var in y.items())
+    Jmax = gp.quicksum(S[o] + duration for o, (_, duration, _, _) in operations.items())
+    model.setObjective(weights[0]*Cmax + weights[1]*energy_consumed + weights[2]*Jmax, GRB.MINIMIZE)
+
+    return model, {"S": S, "y": y, "z": z, "operations": operations}
+
+
+# Ablaufplan (Format aus dispatching.py) als Startlösung setzen
+def warm_start_disjunctive(model, variables, schedule):
+    S, y, z = variables["S"], variables["y"], variables["z"]
+    entries = {(entry["job"], entry["step"]): entry for entry in schedule}
+    model.setAttr("Start", list(y.values()), [0]*len(y))
+    for o, entry in entries.items():
+        if o in S:
+            S[o].Start = entry["start"]
+            if o + (entry["machine"],) in y:
+                y[o + (entry["machine"],)].Start = 1
+    for a, b in z.keys():
+        if a in entries and b in entries:
+            z[a, b].Start = 1 if entries[a]["start"] <= entries[b]["start"] else 0
+    model.update()
+    model.getVarByName("Cmax").Start = makespan(schedule)
+
+
+# Ablaufplan aus der Lösung lesen
+def extract_disjunctive_schedule(model, variables):
+    start_values = model.getAttr("X", variables["S"])
+    assigned = {(j, idx): m for (j, idx, m), value in model.getAttr("X", variables["y"]).items() if value > 0.5}
+    schedule = []
+    for o, (tech, duration, _, _) in variables["operations"].items():
+        start = round(start_values[o])
+        schedule.append({"job": o[0], "step": o[1], "technology": tech, "machine": assigned[o],
+                         "start": start, "end": start + duration})
+    return schedule
@@ -0,0 +1,128 @@
+# Konstruktive Ablaufplanung ohne Solver (Prioritätsregeln).
+# Ein Ablaufplan ist eine Liste von Einträgen
+#   {"job": j, "step": Index des Arbeitsgangs in job_process_order[j], "technology": tech, "machine": m, "start": t, "end": t + Dauer}
+# in Zeiteinheiten der übergebenen Instanz.
+import itertools
+import warnings
+
+# Prioritätsregeln für die Auswahl des nächsten Prozessschrittes unter allen, die frühestmöglich beginnen können
+#   FIFO: Reihenfolge der Jobs in der Instanz
+#   SPT:  kürzeste Bearbeitungsdauer zuerst
+#   LPT:  längste Bearbeitungsdauer zuerst
+#   EDD:  früheste Fälligkeit (instance["job_due_date"], Jobs ohne Termin zuletzt)
+priority_rules = ("FIFO", "SPT", "LPT", "EDD")
+# Maschinenwahl: "earliest" (frühester Start) oder "energy" (geringster Energieverbrauch, dann frühester Start)
+machine_rules = ("earliest", "energy")
+
+
+# Listenplanung mit Prioritätsregel: In jedem Schritt wird unter den nächsten offenen Prozessschritten aller Jobs
+# derjenige eingeplant, der am frühesten beginnen kann; bei Gleichstand entscheidet die Prioritätsregel.
+# Die Reihenfolge der Schritte eines Jobs wird eingehalten, eine Maschine bearbeitet immer nur einen Schritt gleichzeitig.
+def list_schedule(instance, rule="FIFO", machine_rule="earliest"):
+    technology_allocation = instance["technology_allocation"]
+    job_process_order = instance["job_process_order"]
+    job_quantity = instance["job_quantity"]
+    machine_energy_consumption = instance["machine_energy_consumption"]
+    job_due_date = instance.get("job_due_date", {})
+
+    process_steps = {j: job_process_order[j] for j in instance["jobs"]}
+    next_step = {j: 0 for j in instance["jobs"]}
+    # Freigabezeiten der Jobs und Verfügbarkeit der Maschinen (z. B. aus der rollierenden Planung)
+    job_ready = {j: instance.get("job_release", {}).get(j, 0) for j in instance["jobs"]}
+    machine_free = {m: instance.get("machine_available", {}).get(m, 0) for m in instance["machines"]}
+    schedule = []
+
+    open_jobs = [j for j in instance["jobs"] if process_steps[j]]
+    while open_jobs:
+        # Die Maschinenwahl hängt nur von der Technologie ab: bei "earliest" die Maschine, die zuerst frei wird,
+        # bei "energy" unter den sparsamsten Maschinen die, die zuerst frei wird.
+        if machine_rule == "energy":
+            machine_for = {tech: min(allocated, key=lambda m: (machine_energy_consumption[m], machine_free[m]))
+                           for tech, allocated in technology_allocation.items()}
+        else:
+            machine_for = {tech: min(allocated, key=lambda m: machine_free[m])
+                           for tech, allocated in technology_allocation.items()}
+
+        best = None
+        for position, j in enumerate(open_jobs):
+            tech, duration = process_steps[j][next_step[j]]
+            duration = duration*job_quantity[j]
+            m = machine_for[tech]
+            start = max(job_ready[j], machine_free[m])
+
+            if rule == "SPT":
+                priority = duration
+            elif rule == "LPT":
+                priority = -duration
+            elif rule == "EDD":
+                priority = job_due_date.get(j, float("inf"))
+            else:
+                priority = position
+
+            if best is None or (start, priority) < best[:2]:
+                best = (start, priority, j, tech, duration, m)
+
+        start, _, j, tech, duration, m = best
+        schedule.append({"job": j, "step": next_step[j], "technology": tech, "machine": m,
+                         "start": start, "end": start + duration})
+        machine_free[m] = start + duration
+        job_ready[j] = start + duration
+        next_step[j] += 1
+        if next_step[j] == len(process_steps[j]):
+            open_jobs.remove(j)
+
+    return schedule
+
+
+# Gesamtdauer (Makespan) eines Ablaufplans
+def makespan(schedule):
+    return max((entry["end"] for entry in schedule), default=0)
+
+
+# Kennzahlen eines Ablaufplans: Makespan, Energieverbrauch, Summe der Endzeiten aller Schritte (Jmax im Modell)
+# und Summe der Fertigstellungszeiten der Jobs
+def schedule_metrics(instance, schedule):
+    machine_energy_consumption = instance["machine_energy_consumption"]
+    job_completion = {}
+    for entry in schedule:
+        job_completion[entry["job"]] = max(job_completion.get(entry["job"], 0), entry["end"])
+    return {"makespan": makespan(schedule),
+            "energy": sum(machine_energy_consumption[entry["machine"]] for entry in schedule),
+            "step_completion": sum(entry["end"] for entry in schedule),
+            "total_completion": sum(job_completion.values())}
+
+
+# Zielfunktionswert wie im Modell: Cmax + energy_consumed + Jmax (Summe der Endzeiten aller Schritte), gewichtet
+def schedule_objective(instance, schedule, weights=(1, 1, 1)):
+    metrics = schedule_metrics(instance, schedule)
+    return weights[0]*metrics["makespan"] + weights[1]*metrics["energy"] + weights[2]*metrics["step_completion"]
+
+
+# Schneller Modus: alle Kombinationen aus Prioritätsregel und Maschinenwahl durchrechnen
+# und den Ablaufplan mit dem besten Zielfunktionswert zurückgeben. Benötigt keinen Solver.
+def dispatch(instance, rules=priority_rules, machine_rules=machine_rules, weights=(1, 1, 1)):
+    best = None
+    for rule, machine_rule in itertools.product(rules, machine_rules):
+        schedule = list_schedule(instance, rule, machine_rule)
+        objective = schedule_objective(instance, schedule, weights)
+        if best is None or objective < best[0]:
+            best = (objective, schedule)
+    return best[1]
+
+
+# Ablaufplan als Startlösung (MIP-Start) in die Variablen x[j, m, step, t] schreiben.
+# Einträge außerhalb des Variablenindex (z. B. jenseits des Horizonts) werden mit einer Warnung übergangen,
+# die Startlösung ist dann unvollständig.
+def warm_start(model, x, schedule):
+    model.setAttr("Start", list(x.values()), [0]*len(x))
+    missing = []
+    for entry in schedule:
+        key = (entry["job"], entry["machine"], entry["step"], entry["start"])
+        if key in x:
+            x[key].Start = 1
+        else:
+            missing.append(key)
+    if missing:
+        warnings.warn(f"Startlösung passt nicht in den Variablenindex, {len(missing)} Einträge übergangen: {missing[:5]}")
+    model.update()
+    model.getVarByName("Cmax").Start = makespan(schedule)
@@ -0,0 +1,272 @@
+# Inkrementelle Umplanung für den laufenden Betrieb.
+# Das zeitindizierte Modell (gleiche Nebenbedingungen wie build_model) bleibt zwischen den Umplanungen bestehen.
+# Änderungen (neuer Auftrag, stornierter Auftrag, Maschinenausfall, bereits begonnene Schritte) verändern nur die
+# betroffenen Variablen und Nebenbedingungen; anschließend wird mit dem bisherigen Plan als Startlösung neu optimiert.
+import time
+
+import gurobipy as gp
+from gurobipy import GRB
+import tabulate
+
+from dispatching import schedule_objective
+from optimization_algorithm import instance, objective_weights, planning_horizon
+from time_indexed_model import extract_schedule, operation_table
+
+
+class IncrementalScheduler:
+    def __init__(self, instance, time_period=None, horizon_slack=1.5, time_limit=10, weights=objective_weights):
+        # Eigene Kopie der veränderlichen Daten, damit Änderungen die übergebene Instanz nicht berühren
+        self.instance = dict(instance)
+        for key in ("jobs", "job_designations", "job_process_order", "job_quantity", "job_release"):
+            self.instance[key] = type(instance.get(key, {}))(instance.get(key, {}))
+        # Großzügiger Horizont, damit neue Aufträge und Ausfälle ohne Neuaufbau hineinpassen
+        self.time_period = time_period or planning_horizon(instance, horizon_slack)
+        self.time_limit = time_limit
+        self.weights = weights
+        self.blocked = {}   # m -> [(Beginn, Ende)] gesperrter Intervalle
+        self.fixed = {}     # (j, step) -> (m, t) bereits begonnener Arbeitsgänge
+        self.restart = {}   # (j, step) -> frühester Neustart eines durch einen Ausfall abgebrochenen Arbeitsgangs
+        self.now = 0        # kein offener Schritt darf vor diesem Zeitpunkt beginnen
+        self.schedule = None
+        self._build()
+
+    # Modell vollständig aus dem aktuellen Zustand aufbauen (Erstaufbau und Rückfallebene)
+    def _build(self):
+        self._built = False
+        self.model = gp.Model("JobSchedulingIncremental")
+        self.model.Params.TimeLimit = self.time_limit
+        self.Cmax = self.model.addVar(vtype=GRB.INTEGER, obj=self.weights[0], name="Cmax")
+        self.x = gp.tupledict()
+        self.op_vars = {}        # (j, step) -> Schlüssel der Startvariablen
+        self.job_constrs = {}    # j -> Nebenbedingungen des Jobs (assign, sequence, cmax)
+        self.conflict_terms = {} # (m, t) -> Schlüssel der Startvariablen, die m in t belegen
+        self.conflict = {}       # (m, t) -> conflict-Nebenbedingung
+        for j in self.instance["jobs"]:
+            self._add_job_variables(j)
+        for (m, t), terms in self.conflict_terms.items():
+            if self._needs_conflict_row(terms):
+                self.conflict[m, t] = self.model.addConstr(gp.quicksum(self.x[key] for key in terms) <= 1, name=f"conflict_{m}_{t}")
+        for j in self.instance["jobs"]:
+            self._add_job_constraints(j)
+        self._built = True
+
+    # Modell ohne Startlösung neu aufbauen (entspricht einer Umplanung von Grund auf)
+    def rebuild(self):
+        self.model.dispose()
+        self._build()
+        self.schedule = None
+
+    def _duration(self, j, step):
+        return self.instance["job_process_order"][j][step][1]*self.instance["job_quantity"][j]
+
+    # Eine conflict-Zeile ist nur nötig, wenn sich Starts verschiedener Arbeitsgänge (j, step) die Periode teilen
+    def _needs_conflict_row(self, terms):
+        return any((key[0], key[2]) != (terms[0][0], terms[0][2]) for key in terms)
+
+    def _is_blocked(self, m, start, end):
+        return any(start < block_end and block_start < end for block_start, block_end in self.blocked.get(m, []))
+
+    # Zulässige Startvariablen eines Jobs anlegen und in die conflict-Zeilen eintragen.
+    # Zeitfenster wie im Gesamtmodell aus operation_table (Freigabe, machine_available, propagiert), zusätzlich nicht
+    # vor now bzw. dem Ende festgeschriebener Vorgänger und nicht in gesperrten Intervallen.
+    # Ein festgeschriebener Schritt erhält nur die Variable seiner tatsächlichen Belegung (fixiert auf 1).
+    def _add_job_variables(self, j):
+        energy = self.instance["machine_energy_consumption"]
+        table = operation_table(dict(self.instance, jobs=[j]), self.time_period)
+        machines = {}
+        for step, m, earliest in zip(table["pair_operation"].tolist(), table["pair_machine"].tolist(), table["pair_earliest"].tolist()):
+            machines.setdefault(step, []).append((m, earliest))
+        ready = self.now
+        for step in range(len(self.instance["job_process_order"][j])):
+            duration = int(table["duration"][step])
+            if (j, step) in self.fixed:
+                m, t = self.fixed[j, step]
+                candidates = [(m, t)]
+                ready = t + duration
+            else:
+                earliest = max(int(table["earliest"][step]), ready, self.restart.get((j, step), 0))
+                candidates = [(m, t) for m, machine_earliest in machines.get(step, [])
+                              for t in range(max(machine_earliest, earliest), int(table["latest"][step]) + 1)
+                              if not self._is_blocked(m, t, t + duration)]
+                ready = earliest + duration
+
+            keys = []
+            for m, t in candidates:
+                var = self.model.addVar(vtype=GRB.BINARY, obj=self.weights[1]*energy[m] + self.weights[2]*(t + duration),
+                                        name=f"x[{j},{m},{step},{t}]")
+                if (j, step) in self.fixed:
+                    var.LB = 1
+                self.x[j, m, step, t] = var
+                keys.append((j, m, step, t))
+                for period in range(t, t + duration):
+                    terms = self.conflict_terms.setdefault((m, period), [])
+                    terms.append((j, m, step, t))
+                    if (m, period) in self.conflict:
+                        self.model.chgCoeff(self.conflict[m, period], var, 1)
+                    elif self._built and self._needs_conflict_row(terms):
+                        # Nach dem Erstaufbau: neue Zeile, sobald sich zwei Arbeitsgänge eine Periode teilen
+                        self.conflict[m, period] = self.model.addConstr(gp.quicksum(self.x[key] for key in terms) <= 1,
+                                                                        name=f"conflict_{m}_{period}")
+            self.op_vars[j, step] = keys
+
+    # assign-, Sequence- und cmax-Nebenbedingungen eines Jobs
+    def _add_job_constraints(self, j):
+        x = self.x
+        constrs = []
+        steps = range(len(self.instance["job_process_order"][j]))
+        for step in steps:
+            constrs.append(self.model.addConstr(gp.quicksum(x[key] for key in self.op_vars[j, step]) == 1, name=f"assign_{j}_{step}"))
+        for step in steps[1:]:
+            duration_prev = self._duration(j, step - 1)
+            constrs.append(self.model.addConstr(
+                gp.quicksum((key[3] + duration_prev)*x[key] for key in self.op_vars[j, step - 1])
+                <= gp.quicksum(key[3]*x[key] for key in self.op_vars[j, step]),
+                name=f"Sequence. Job: {j}; step_jetzt:{step}"))
+        for step in steps:
+            duration = self._duration(j, step)
+            for m in self.instance["technology_allocation"][self.instance["job_process_order"][j][step][0]]:
+                keys = [key for key in self.op_vars[j, step] if key[1] == m]
+                if keys:
+                    constrs.append(self.model.addConstr(gp.quicksum((key[3] + duration)*x[key] for key in keys) <= self.Cmax,
+                                                        name=f"cmax_{j}_{step}_{m}"))
+        self.job_constrs[j] = constrs
+
+    def _remove_variables(self, keys):
+        for key in keys:
+            var = self.x.pop(key)
+            j, m, step, t = key
+            for period in range(t, t + self._duration(j, step)):
+                self.conflict_terms[m, period].remove(key)
+            self.model.remove(var)
+
+    # Variablen und Nebenbedingungen eines Jobs aus dem aktuellen Zustand (fixed, blocked, now, restart) neu anlegen
+    def _replan_job(self, j):
+        for step in range(len(self.instance["job_process_order"][j])):
+            self._remove_variables(self.op_vars.pop((j, step)))
+        self.model.remove(self.job_constrs.pop(j))
+        self._add_job_variables(j)
+        self._add_job_constraints(j)
+
+    # Neuer Auftrag (z. B. Eilauftrag): process_order wie job_process_order[j] als Liste (tech, Dauer), frühestens ab release
+    def add_job(self, j, process_order, quantity=1, release=0, designation=None):
+        self.instance["jobs"].append(j)
+        self.instance["job_process_order"][j] = list(process_order)
+        self.instance["job_quantity"][j] = quantity
+        self.instance["job_release"][j] = release
+        self.instance["job_designations"][j] = designation or f"Prod{j}"
+        self._add_job_variables(j)
+        self._add_job_constraints(j)
+
+    # Auftrag storniert: alle Variablen und Nebenbedingungen des Jobs entfernen
+    def remove_job(self, j):
+        for step in range(len(self.instance["job_process_order"][j])):
+            self._remove_variables(self.op_vars.pop((j, step)))
+            self.fixed.pop((j, step), None)
+            self.restart.pop((j, step), None)
+        self.model.remove(self.job_constrs.pop(j))
+        self.instance["jobs"].remove(j)
+        for key in ("job_process_order", "job_quantity", "job_release", "job_designations"):
+            self.instance[key].pop(j, None)
+        if self.schedule is not None:
+            self.schedule = [entry for entry in self.schedule if entry["job"] != j]
+
+    # Maschine m von start bis end gesperrt (Ausfall, Wartung): Starts, deren Belegung das Intervall schneidet, entfallen.
+    # Ein festgeschriebener Schritt, der in den Ausfall fällt, gilt als abgebrochen: Er wird mit allen Nachfolgern
+    # seines Jobs freigegeben und frühestens ab Beginn des Ausfalls (bzw. ab now) neu eingeplant.
+    def block_machine(self, m, start, end):
+        self.blocked.setdefault(m, []).append((start, end))
+        interrupted = {}
+        for op, keys in self.op_vars.items():
+            if op in self.fixed:
+                fixed_machine, t = self.fixed[op]
+                if fixed_machine == m and self._is_blocked(m, t, t + self._duration(*op)):
+                    interrupted[op[0]] = min(op[1], interrupted.get(op[0], op[1]))
+                continue
+            affected = [key for key in keys if key[1] == m and self._is_blocked(m, key[3], key[3] + self._duration(key[0], key[2]))]
+            if affected:
+                self._remove_variables(affected)
+                self.op_vars[op] = [key for key in keys if key not in affected]
+        for j, step in interrupted.items():
+            for later in range(step, len(self.instance["job_process_order"][j])):
+                self.fixed.pop((j, later), None)
+            self.restart[j, step] = max(start, self.now)
+            self._replan_job(j)
+
+    # Zeitpunkt now erreicht: Schritte des aktuellen Plans, die schon begonnen haben, werden festgeschrieben,
+    # alle übrigen dürfen nicht mehr vor now beginnen. Ist die Belegung eines begonnenen Schritts inzwischen durch
+    # block_machine entfallen (Ausfall während der Bearbeitung), gilt er als abgebrochen und wird mit allen
+    # Nachfolgern seines Jobs ab now neu eingeplant.
+    def fix_started_operations(self, now):
+        self.now = now
+        started = {(entry["job"], entry["step"]): (entry["machine"], entry["start"])
+                   for entry in self.schedule or [] if entry["start"] < now}
+        interrupted = set()
+        for op, keys in sorted(self.op_vars.items()):
+            if op in self.fixed:
+                continue
+            if op in started and (op[0], started[op][0], op[1], started[op][1]) not in self.x:
+                interrupted.add(op[0])
+            if op in started and op[0] not in interrupted:
+                self.fixed[op] = started[op]
+                m, t = started[op]
+                self._remove_variables([key for key in keys if (key[1], key[3]) != (m, t)])
+                self.op_vars[op] = [(op[0], m, op[1], t)]
+                self.x[op[0], m, op[1], t].LB = 1
+            else:
+                outdated = [key for key in keys if key[3] < now]
+                if outdated:
+                    self._remove_variables(outdated)
+                    self.op_vars[op] = [key for key in keys if key[3] >= now]
+
+    # Neu optimieren; der bisherige Plan dient als (ggf. unvollständige) Startlösung.
+    # Passt der Plan nach einer Änderung nicht mehr in den Horizont, wird mit doppeltem Horizont neu aufgebaut.
+    # Rückgabe: neuer Ablaufplan oder None ohne zulässige Lösung (der bisherige Plan bleibt dann erhalten).
+    def optimize(self):
+        if self.schedule is not None:
+            self.model.setAttr("Start", list(self.x.values()), [GRB.UNDEFINED]*len(self.x))
+            for entry in self.schedule:
+                key = (entry["job"], entry["machine"], entry["step"], entry["start"])
+                if key in self.x:
+                    for other in self.op_vars[entry["job"], entry["step"]]:
+                        self.x[other].Start = 0
+                    self.x[key].Start = 1
+        self.model.optimize()
+        if self.model.SolCount == 0 and self.model.Status == GRB.INFEASIBLE:
+            self.time_period = range(2*len(self.time_period))
+            self.rebuild()
+            self.model.optimize()
+        if self.model.SolCount == 0:
+            return None
+        self.schedule = extract_schedule(self.model, self.instance, self.x)
+        return self.schedule
+
+
+# Beispiel aus dem Betrieb: Zum Zeitpunkt now trifft ein Eilauftrag ein und die HELLER - HF 3500 fällt aus.
+# Verglichen wird die inkrementelle Umplanung mit einem Neuaufbau ohne Startlösung.
+def compare_replanning(instance, now=5, rush_job=((0, 1), (1, 2), (2, 2)), machine=6, downtime=(6, 8)):
+    scheduler = IncrementalScheduler(instance)
+    scheduler.optimize()
+
+    start = time.perf_counter()
+    scheduler.fix_started_operations(now)
+    rush = max(scheduler.instance["jobs"]) + 1
+    scheduler.add_job(rush, rush_job, release=now, designation="Eilauftrag")
+    scheduler.block_machine(machine, *downtime)
+    incremental = scheduler.optimize()
+    incremental_time = time.perf_counter() - start
+    incremental_objective = schedule_objective(scheduler.instance, incremental)
+
+    start = time.perf_counter()
+    scheduler.rebuild()
+    from_scratch = scheduler.optimize()
+    from_scratch_time = time.perf_counter() - start
+
+    print(tabulate.tabulate([["inkrementell", incremental_objective, incremental_time],
+                             ["Neuaufbau", schedule_objective(scheduler.instance, from_scratch), from_scratch_time]],
+                            headers=["Umplanung", "Ziel (Cmax + Energie + Jmax)", "Zeit [s]"], tablefmt="grid", floatfmt=".3f"))
+    return incremental
+
+
+if __name__ == "__main__":
+    gp.setParam("OutputFlag", 0)
+    compare_replanning(instance)
@@ -0,0 +1,77 @@
+# Synthetische Instanzen im Format von optimization_algorithm.instance für Skalierungstests.
+import random
+
+
+# Zufallsgenerator nach Taillard (1993), damit Instanzen wie in den Benchmark-Sätzen allein über die Seeds reproduzierbar sind
+class TaillardRandom:
+    def __init__(self, seed):
+        self.seed = seed
+
+    # Ganzzahl gleichverteilt in [low, high]
+    def randint(self, low, high):
+        k = self.seed // 127773
+        self.seed = 16807*(self.seed % 127773) - k*2836
+        if self.seed < 0:
+            self.seed += 2147483647
+        return low + int(self.seed/2147483647*(high - low + 1))
+
+    def sample(self, population, k):
+        population = list(population)
+        for i in range(k):
+            swap = self.randint(i, len(population) - 1)
+            population[i], population[swap] = population[swap], population[i]
+        return population[:k]
+
+
+# Instanz aus bereits gezogenen Daten zusammensetzen
+def _instance(machines, technology_allocation, job_process_order, machine_energy_consumption):
+    technologies = sorted(technology_allocation)
+    jobs = sorted(job_process_order)
+    return {"machines": machines,
+            "machine_designations": {m: f"Maschine {m}" for m in machines},
+            "machine_energy_consumption": machine_energy_consumption,
+            "technologies": technologies,
+            "technology_designations": {tech: f"Technologie {tech}" for tech in technologies},
+            "technology_allocation": technology_allocation,
+            "jobs": jobs,
+            "job_designations": {j: f"Prod{j}" for j in jobs},
+            "job_process_order": job_process_order,
+            "job_quantity": {j: 1 for j in jobs}}
+
+
+# Zufällige Instanz: Jeder Job durchläuft eine zufällige Folge verschiedener Technologien,
+# jede Technologie wird von einer zufälligen Teilmenge der Maschinen beherrscht.
+def random_instance(n_jobs, n_machines, n_technologies, steps_per_job=(1, 3), duration_range=(1, 6),
+                    machines_per_technology=(1, 3), energy_range=(10, 100), seed=0):
+    rng = random.Random(seed)
+    machines = list(range(n_machines))
+    technology_allocation = {tech: sorted(rng.sample(machines, rng.randint(*machines_per_technology)))
+                             for tech in range(n_technologies)}
+    job_process_order = {}
+    for j in range(n_jobs):
+        n_steps = rng.randint(steps_per_job[0], min(steps_per_job[1], n_technologies))
+        job_process_order[j] = [(tech, rng.randint(*duration_range)) for tech in rng.sample(range(n_technologies), n_steps)]
+    machine_energy_consumption = {m: rng.randint(*energy_range) for m in machines}
+    return _instance(machines, technology_allocation, job_process_order, machine_energy_consumption)
+
+
+# Flexible Job-Shop-Instanz nach Taillard: Jeder Job durchläuft alle Technologien in zufälliger Reihenfolge,
+# Bearbeitungszeiten gleichverteilt in 1..99 (über duration_range anpassbar). Die Maschinen werden
+# reihum auf die Technologien verteilt, jede Technologie hat damit n_machines / n_technologies Maschinen.
+# Wie bei Taillard werden erst alle Bearbeitungszeiten aus seed (Zeit-Seed) gezogen, dann die Reihenfolgen aus
+# machine_seed; die Voreinstellung ergibt mit n_jobs = n_machines = 15 Dauern und Reihenfolgen von ta01.
+# Die Energieverbräuche werden danach aus dem Maschinen-Strom gezogen.
+def taillard_instance(n_jobs, n_machines, n_technologies=None, duration_range=(1, 99), energy_range=(10, 100),
+                      seed=840612802, machine_seed=398197754):
+    n_technologies = n_technologies or n_machines
+    time_rng = TaillardRandom(seed)
+    machine_rng = TaillardRandom(machine_seed)
+    machines = list(range(n_machines))
+    # Gibt es weniger Maschinen als Technologien, teilen sich mehrere Technologien eine Maschine
+    technology_allocation = {tech: [m for m in machines if m % n_technologies == tech] or [tech % n_machines]
+                             for tech in range(n_technologies)}
+    durations = [[time_rng.randint(*duration_range) for _ in range(n_technologies)] for _ in range(n_jobs)]
+    job_process_order = {j: list(zip(machine_rng.sample(range(n_technologies), n_technologies), durations[j]))
+                         for j in range(n_jobs)}
+    machine_energy_consumption = {m: machine_rng.randint(*energy_range) for m in machines}
+    return _instance(machines, technology_allocation, job_process_order, machine_energy_consumption)
@@ -0,0 +1,257 @@
+# Einlesen von Planungsinstanzen aus Dateien (z. B. ERP-Exporte) statt aus den Daten in optimization_algorithm.py.
+#   JSON:          eine Datei, Aufbau wie bei save_instance
+#   CSV / Parquet: ein Verzeichnis mit den Tabellen
+#                  machines     (machine, designation, energy_consumption)
+#                  technologies (technology, designation)
+#                  allocation   (technology, machine)
+#                  jobs         (job, designation, quantity[, release, due_date])
+#                  operations   (job, step, technology, duration)
+# Als kompaktes NumPy-Array liefert operation_array die Prozessschritte; es wird bei Bedarf aus job_process_order
+# erzeugt (einzige Quelle) und kann daher nach Änderungen an den Arbeitsplänen nicht veralten.
+# Eingelesene Instanzen werden unter dem Hash der Dateiinhalte zwischengespeichert (im Speicher und in cache_dir),
+# sodass wiederholte Planungsläufe große Exporte nicht erneut parsen.
+import hashlib
+import json
+import os
+import pickle
+from typing import TypedDict
+
+import numpy as np
+
+# Kompakte Darstellung der Prozessschritte, sortiert nach (job, step)
+operation_dtype = np.dtype([("job", np.int32), ("step", np.int32), ("technology", np.int32), ("duration", np.int32)])
+
+table_names = ("machines", "technologies", "allocation", "jobs", "operations")
+cache_dir = ".instance_cache"
+_cache = {}
+
+
+class Instance(TypedDict, total=False):
+    machines: list[int]
+    machine_designations: dict[int, str]
+    machine_energy_consumption: dict[int, float]
+    technologies: list[int]
+    technology_designations: dict[int, str]
+    technology_allocation: dict[int, list[int]]
+    jobs: list[int]
+    job_designations: dict[int, str]
+    job_process_order: dict[int, list[tuple[int, int]]]
+    job_quantity: dict[int, int]
+    # optional
+    job_release: dict[int, int]
+    job_due_date: dict[int, int]
+    machine_available: dict[int, int]
+    time_bucket: int
+
+
+# Prozessschritte aus job_process_order als Array, sortiert nach der Reihenfolge in instance["jobs"] und nach Schritt
+def operation_array(instance):
+    return np.array([(j, step, tech, duration) for j in instance["jobs"]
+                     for step, (tech, duration) in enumerate(instance["job_process_order"][j])],
+                    dtype=operation_dtype)
+
+
+# Instanz auf Vollständigkeit und Konsistenz prüfen; alle Fehler werden gesammelt gemeldet.
+# operations: eingelesene Prozessschritte (operation_dtype, nach Job und Schritt sortiert) zur Prüfung der Schrittnummern
+def validate_instance(instance, operations=None):
+    errors = []
+    machines = set(instance["machines"])
+    technologies = set(instance["technologies"])
+    for m in machines - set(instance["machine_energy_consumption"]):
+        errors.append(f"Maschine {m}: kein Energieverbrauch angegeben")
+    for tech in technologies:
+        allocated = instance["technology_allocation"].get(tech, [])
+        if not allocated:
+            errors.append(f"Technologie {tech}: keine Maschine zugeordnet")
+        for m in set(allocated) - machines:
+            errors.append(f"Technologie {tech}: unbekannte Maschine {m}")
+    for j in instance["jobs"]:
+        if j not in instance["job_process_order"] or not instance["job_process_order"][j]:
+            errors.append(f"Job {j}: keine Prozessschritte")
+            continue
+        for step, (tech, duration) in enumerate(instance["job_process_order"][j]):
+            if tech not in technologies:
+                errors.append(f"Job {j}, Schritt {step}: unbekannte Technologie {tech}")
+            if duration <= 0 or duration != int(duration):
+                errors.append(f"Job {j}, Schritt {step}: Dauer {duration} ist keine positive ganze Zahl")
+        quantity = instance["job_quantity"].get(j)
+        if quantity is None or quantity <= 0 or quantity != int(quantity):
+            errors.append(f"Job {j}: Stückzahl {quantity} ist keine positive ganze Zahl")
+    # Schrittnummern aus Dateien müssen je Job 0..n-1 sein
+    if operations is not None:
+        jobs, first, counts = np.unique(operations["job"], return_index=True, return_counts=True)
+        expected = np.arange(len(operations)) - np.repeat(first, counts)
+        for j in np.unique(operations["job"][operations["step"] != expected]).tolist():
+            steps = operations["step"][operations["job"] == j].tolist()
+            errors.append(f"Job {j}: Schrittnummern {steps} sind nicht lückenlos 0 bis {len(steps) - 1}")
+    if len(set(instance["jobs"])) != len(instance["jobs"]):
+        errors.append("Jobnummern sind nicht eindeutig")
+    if errors:
+        raise ValueError("Ungültige Instanz:\n  " + "\n  ".join(errors))
+    return instance
+
+
+# Instanz aus den fünf Tabellen (Spalten wie oben, je Tabelle ein Dict von Spalte -> Array) zusammensetzen
+def _from_tables(tables):
+    machines, technologies, allocation, jobs, operations = (tables[name] for name in table_names)
+
+    operation_records = np.empty(len(operations["job"]), dtype=operation_dtype)
+    for field in operation_dtype.names:
+        operation_records[field] = operations[field]
+    operation_records.sort(order=["job", "step"])
+
+    job_ids = [int(j) for j in jobs["job"]]
+    job_process_order = {j: [] for j in job_ids}
+    for j, _, tech, duration in operation_records.tolist():
+        if j not in job_process_order:
+            raise ValueError(f"Ungültige Instanz: Prozessschritt für unbekannten Job {j}")
+        job_process_order[j].append((tech, duration))
+
+    machine_ids = [int(m) for m in machines["machine"]]
+    technology_ids = [int(tech) for tech in technologies["technology"]]
+    technology_allocation = {tech: [] for tech in technology_ids}
+    for tech, m in zip(allocation["technology"], allocation["machine"]):
+        technology_allocation.setdefault(int(tech), []).append(int(m))
+
+    instance = Instance(machines=machine_ids,
+                        machine_designations=dict(zip(machine_ids, map(str, machines["designation"]))),
+                        machine_energy_consumption=dict(zip(machine_ids, np.asarray(machines["energy_consumption"]).tolist())),
+                        technologies=technology_ids,
+                        technology_designations=dict(zip(technology_ids, map(str, technologies["designation"]))),
+                        technology_allocation=technology_allocation,
+                        jobs=job_ids,
+                        job_designations=dict(zip(job_ids, map(str, jobs["designation"]))),
+                        job_process_order=job_process_order,
+                        job_quantity=dict(zip(job_ids, np.asarray(jobs["quantity"]).tolist())))
+    # Optionale Spalten; leere Zellen (NaN) bedeuten keine Vorgabe
+    for column, key in (("release", "job_release"), ("due_date", "job_due_date")):
+        if column in jobs:
+            instance[key] = {j: int(value) for j, value in zip(job_ids, jobs[column]) if value == value}
+    return validate_instance(instance, operation_records)
+
+
+def _read_json(path):
+    with open(path) as f:
+        data = json.load(f)
+    tables = {"machines": {"machine": [], "designation": [], "energy_consumption": []},
+              "technologies": {"technology": [], "designation": []},
+              "allocation": {"technology": [], "machine": []},
+              "jobs": {"job": [], "designation": [], "quantity": [], "release": [], "due_date": []},
+              "operations": {"job": [], "step": [], "technology": [], "duration": []}}
+    for machine in data["machines"]:
+        for column in tables["machines"]:
+            tables["machines"][column].append(machine[column])
+    for technology in data["technologies"]:
+        tables["technologies"]["technology"].append(technology["technology"])
+        tables["technologies"]["designation"].append(technology["designation"])
+        for m in technology["machines"]:
+            tables["allocation"]["technology"].append(technology["technology"])
+            tables["allocation"]["machine"].append(m)
+    for job in data["jobs"]:
+        tables["jobs"]["job"].append(job["job"])
+        tables["jobs"]["designation"].append(job.get("designation", f"Prod{job['job']}"))
+        tables["jobs"]["quantity"].append(job.get("quantity", 1))
+        tables["jobs"]["release"].append(job.get("release", float("nan")))
+        tables["jobs"]["due_date"].append(job.get("due_date", float("nan")))
+        for step, (tech, duration) in enumerate(job["operations"]):
+            for column, value in zip(("job", "step", "technology", "duration"), (job["job"], step, tech, duration)):
+                tables["operations"][column].append(value)
+    return tables
+
+
+def _read_directory(path):
+    import pandas as pd
+
+    tables = {}
+    for name in table_names:
+        if os.path.exists(os.path.join(path, f"{name}.parquet")):
+            frame = pd.read_parquet(os.path.join(path, f"{name}.parquet"))
+        else:
+            frame = pd.read_csv(os.path.join(path, f"{name}.csv"))
+        tables[name] = {column: frame[column].to_numpy() for column in frame.columns}
+    return tables
+
+
+# Dateien einer Instanz (JSON-Datei oder Verzeichnis mit Tabellen)
+def _instance_files(path):
+    if os.path.isdir(path):
+        return sorted(os.path.join(path, name) for name in os.listdir(path)
+                      if os.path.splitext(name)[0] in table_names and name.endswith((".csv", ".parquet")))
+    return [path]
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    for file in _instance_files(path):
+        digest.update(os.path.basename(file).encode())
+        with open(file, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Instanz laden. Ist der Inhalt schon einmal eingelesen worden, wird die zwischengespeicherte Instanz verwendet.
+# cache_dir=None schaltet den Zwischenspeicher auf der Festplatte ab.
+def load_instance(path, cache_dir=cache_dir):
+    key = file_hash(path)
+    if key in _cache:
+        return _cache[key]
+    cache_file = os.path.join(cache_dir, f"{key}.pickle") if cache_dir else None
+    if cache_file and os.path.exists(cache_file):
+        with open(cache_file, "rb") as f:
+            instance = pickle.load(f)
+    else:
+        instance = _from_tables(_read_directory(path) if os.path.isdir(path) else _read_json(path))
+        if cache_file:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(cache_file, "wb") as f:
+                pickle.dump(instance, f, protocol=pickle.HIGHEST_PROTOCOL)
+    _cache[key] = instance
+    return instance
+
+
+# Instanz als JSON-Datei im Format von load_instance speichern
+def save_instance(instance, path):
+    job_release = instance.get("job_release", {})
+    job_due_date = instance.get("job_due_date", {})
+    jobs = []
+    for j in instance["jobs"]:
+        job = {"job": j, "designation": instance["job_designations"][j], "quantity": instance["job_quantity"][j],
+               "operations": [[tech, duration] for tech, duration in instance["job_process_order"][j]]}
+        if j in job_release:
+            job["release"] = job_release[j]
+        if j in job_due_date:
+            job["due_date"] = job_due_date[j]
+        jobs.append(job)
+    data = {"machines": [{"machine": m, "designation": instance["machine_designations"][m],
+                          "energy_consumption": instance["machine_energy_consumption"][m]} for m in instance["machines"]],
+            "technologies": [{"technology": tech, "designation": instance["technology_designations"][tech],
+                              "machines": instance["technology_allocation"][tech]} for tech in instance["technologies"]],
+            "jobs": jobs}
+    with open(path, "w") as f:
+        json.dump(data, f, indent=1, ensure_ascii=False)
+
+
+# Instanz als Verzeichnis mit CSV- oder Parquet-Tabellen speichern (z. B. als Vorlage für ERP-Exporte)
+def save_instance_tables(instance, path, file_format="csv"):
+    import pandas as pd
+
+    tables = {"machines": pd.DataFrame({"machine": instance["machines"],
+                                        "designation": [instance["machine_designations"][m] for m in instance["machines"]],
+                                        "energy_consumption": [instance["machine_energy_consumption"][m] for m in instance["machines"]]}),
+              "technologies": pd.DataFrame({"technology": instance["technologies"],
+                                            "designation": [instance["technology_designations"][tech] for tech in instance["technologies"]]}),
+              "allocation": pd.DataFrame([(tech, m) for tech in instance["technologies"] for m in instance["technology_allocation"][tech]],
+                                         columns=["technology", "machine"]),
+              "jobs": pd.DataFrame({"job": instance["jobs"],
+                                    "designation": [instance["job_designations"][j] for j in instance["jobs"]],
+                                    "quantity": [instance["job_quantity"][j] for j in instance["jobs"]],
+                                    "release": [instance.get("job_release", {}).get(j) for j in instance["jobs"]],
+                                    "due_date": [instance.get("job_due_date", {}).get(j) for j in instance["jobs"]]}),
+              "operations": pd.DataFrame(operation_array(instance))}
+    os.makedirs(path, exist_ok=True)
+    for name, frame in tables.items():
+        if file_format == "parquet":
+            frame.to_parquet(os.path.join(path, f"{name}.parquet"), index=False)
+        else:
+            frame.to_csv(os.path.join(path, f"{name}.csv"), index=False)
@@ -0,0 +1,185 @@
+# Large Neighbourhood Search (LNS) um das zeitindizierte Modell für große Instanzen.
+# Ausgehend von einem zulässigen Ablaufplan wird in jeder Iteration eine Nachbarschaft freigegeben
+#   machine_group: Arbeitsgänge einer Technologie (und damit einer Maschinengruppe aus technology_allocation),
+#                  zeitlich zusammenhängend ab einer zufälligen Stelle
+#   time_window:   alle Arbeitsgänge, die in einem zufälligen Zeitfenster beginnen
+#   random_jobs:   alle Arbeitsgänge zufällig gewählter Jobs
+# und alle übrigen Arbeitsgänge werden über die Schranken ihrer Startvariablen auf ihre bisherige Lage fixiert.
+# Das Teilproblem wird mit kurzem Zeitlimit gelöst, Verbesserungen werden übernommen. Das Modell wird je Prozess nur
+# einmal aufgebaut. Nachbarschaften ohne gemeinsame Jobs und Maschinen werden parallel in eigenen Prozessen gelöst.
+import concurrent.futures
+import random
+import time
+
+import gurobipy as gp
+import numpy as np
+import tabulate
+
+from dispatching import dispatch, makespan, schedule_objective, warm_start
+from matrix_model import build_model_matrix
+from optimization_algorithm import instance, objective_weights, planning_horizon
+from profiling import gap_trace, start_telemetry, telemetry_callback
+from time_indexed_model import extract_schedule
+
+neighbourhood_kinds = ("machine_group", "time_window", "random_jobs")
+
+# Modell des aktuellen Prozesses (im Hauptprozess bzw. je Arbeitsprozess einmal aufgebaut)
+_worker = {}
+
+
+def _init_worker(instance, time_period, weights, threads=None):
+    model, x, _ = build_model_matrix(instance, time_period, weights)
+    model.Params.OutputFlag = 0
+    if threads:
+        model.Params.Threads = threads
+    model.update()
+    keys = list(x.keys())
+    _worker.update(instance=instance, model=model, x=x, variables=list(x.values()),
+                   operations=[(j, step) for j, _, step, _ in keys], index={key: i for i, key in enumerate(keys)})
+
+
+# Teilproblem lösen: die Arbeitsgänge in free sind frei, alle übrigen bleiben wie im Ablaufplan.
+# Rückgabe: neuer Ablaufplan oder None, wenn im Zeitlimit keine Lösung gefunden wurde.
+def _solve_neighbourhood(schedule, free, time_limit):
+    model, x, variables, index = _worker["model"], _worker["x"], _worker["variables"], _worker["index"]
+    chosen = np.zeros(len(variables), dtype=bool)
+    chosen[[index[entry["job"], entry["machine"], entry["step"], entry["start"]] for entry in schedule]] = True
+    is_free = np.array([operation in free for operation in _worker["operations"]])
+    model.setAttr("LB", variables, (chosen & ~is_free).astype(float).tolist())
+    model.setAttr("UB", variables, (chosen | is_free).astype(float).tolist())
+    warm_start(model, x, schedule)
+    model.Params.TimeLimit = time_limit
+    model.optimize()
+    return extract_schedule(model, _worker["instance"], x) if model.SolCount > 0 else None
+
+
+# Zufällige Nachbarschaft: Menge freigegebener Arbeitsgänge (j, step)
+def neighbourhood(instance, schedule, kind, rng, jobs_per_neighbourhood=3, window_length=None, max_operations=20):
+    if kind == "machine_group":
+        tech = rng.choice(instance["technologies"])
+        entries = sorted((entry for entry in schedule if entry["technology"] == tech), key=lambda entry: entry["start"])
+        first = rng.randrange(max(1, len(entries) - max_operations + 1))
+        entries = entries[first:first + max_operations]
+    elif kind == "time_window":
+        window_length = window_length or max(1, makespan(schedule)//4)
+        window_start = rng.randrange(max(1, makespan(schedule) - window_length + 1))
+        entries = [entry for entry in schedule if window_start <= entry["start"] < window_start + window_length]
+    elif kind == "random_jobs":
+        jobs = set(rng.sample(instance["jobs"], min(jobs_per_neighbourhood, len(instance["jobs"]))))
+        entries = [entry for entry in schedule if entry["job"] in jobs]
+    else:
+        raise ValueError(f"Unbekannte Nachbarschaft: {kind}")
+    return {(entry["job"], entry["step"]) for entry in entries}
+
+
+# Jobs und Maschinen, die eine Nachbarschaft verändern kann
+def footprint(instance, free):
+    technology = {(j, step): tech for j in instance["jobs"] for step, (tech, _) in enumerate(instance["job_process_order"][j])}
+    machines = {m for operation in free for m in instance["technology_allocation"][technology[operation]]}
+    return {j for j, _ in free}, machines
+
+
+# Bis zu count Nachbarschaften ohne gemeinsame Jobs und Maschinen; sie lassen sich unabhängig lösen und zusammenführen
+def disjoint_neighbourhoods(instance, schedule, count, kinds, rng, **options):
+    batch, used_jobs, used_machines = [], set(), set()
+    for _ in range(10*count):
+        kind = rng.choice(kinds)
+        free = neighbourhood(instance, schedule, kind, rng, **options)
+        jobs, machines = footprint(instance, free)
+        if free and not jobs & used_jobs and not machines & used_machines:
+            batch.append((kind, free))
+            used_jobs |= jobs
+            used_machines |= machines
+            if len(batch) == count:
+                break
+    return batch
+
+
+# LNS mit Zeitbudget. workers > 1: so viele disjunkte Nachbarschaften je Iteration parallel (je Prozess ein Thread).
+# Rückgabe: bester Ablaufplan und Verlauf je Iteration (Zeit, Ziel, Verbesserung je Sekunde seit Beginn).
+def solve_lns(instance, initial_schedule=None, time_budget=60, sub_time_limit=2, workers=1, kinds=neighbourhood_kinds,
+              weights=objective_weights, seed=0, **options):
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    schedule = initial_schedule or dispatch(instance, weights=weights)
+    objective = schedule_objective(instance, schedule, weights)
+    initial_objective = objective
+    # Der Horizont muss den Ausgangsplan enthalten
+    time_period = range(max(len(planning_horizon(instance)), makespan(schedule)))
+
+    executor = None
+    if workers > 1:
+        executor = concurrent.futures.ProcessPoolExecutor(workers, initializer=_init_worker,
+                                                          initargs=(instance, time_period, weights, 1))
+    else:
+        _init_worker(instance, time_period, weights)
+    log = [{"Iteration": 0, "Zeit [s]": time.perf_counter() - start, "Nachbarschaften": "Start", "Ziel": objective,
+            "Verbesserung je s": 0.0}]
+    try:
+        while time.perf_counter() - start < time_budget:
+            batch = disjoint_neighbourhoods(instance, schedule, workers, kinds, rng, **options)
+            if not batch:
+                continue
+            time_limit = max(0.1, min(sub_time_limit, time_budget - (time.perf_counter() - start)))
+            frees = [free for _, free in batch]
+            if executor is not None:
+                results = list(executor.map(_solve_neighbourhood, [schedule]*len(batch), frees, [time_limit]*len(batch)))
+            else:
+                results = [_solve_neighbourhood(schedule, frees[0], time_limit)]
+
+            # Verbesserte Teilpläne zusammenführen; ist die Kombination schlechter als der beste einzelne, gilt dieser
+            improved = []
+            for free, result in zip(frees, results):
+                if result is not None and schedule_objective(instance, result, weights) < objective - 1e-6:
+                    improved.append((schedule_objective(instance, result, weights), free, result))
+            if improved:
+                merged = {(entry["job"], entry["step"]): entry for entry in schedule}
+                for _, free, result in improved:
+                    merged.update({(entry["job"], entry["step"]): entry for entry in result if (entry["job"], entry["step"]) in free})
+                merged = list(merged.values())
+                best_value, _, best_result = min(improved, key=lambda item: item[0])
+                merged_value = schedule_objective(instance, merged, weights)
+                schedule, objective = (merged, merged_value) if merged_value <= best_value else (best_result, best_value)
+
+            elapsed = time.perf_counter() - start
+            log.append({"Iteration": len(log), "Zeit [s]": elapsed, "Nachbarschaften": "+".join(kind for kind, _ in batch),
+                        "Ziel": objective, "Verbesserung je s": (initial_objective - objective)/elapsed})
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return schedule, log
+
+
+# LNS und model.optimize() auf dem vollständigen Modell mit gleichem Zeitbudget und gleicher Startlösung vergleichen:
+# bester Zielfunktionswert beider Verfahren zu festen Zeitpunkten
+def compare_with_optimize(instance, time_budget=30, workers=1, checkpoints=(1, 2, 5, 10, 20, 30, 60), **options):
+    schedule, log = solve_lns(instance, time_budget=time_budget, workers=workers, **options)
+
+    initial_schedule = dispatch(instance)
+    time_period = range(max(len(planning_horizon(instance)), makespan(initial_schedule)))
+    start = time.perf_counter()
+    model, x, _ = build_model_matrix(instance, time_period)
+    warm_start(model, x, initial_schedule)
+    build_time = time.perf_counter() - start
+    model.Params.TimeLimit = max(0.1, time_budget - build_time)
+    start_telemetry(model)
+    model.optimize(telemetry_callback)
+    # Zeitstempel des Callbacks zählen ab optimize(); der Modellaufbau wird hinzugerechnet
+    trace = [(build_time, schedule_objective(instance, initial_schedule))] + \
+            [(build_time + elapsed, incumbent) for elapsed, incumbent, _, _ in gap_trace(model._records) if incumbent is not None]
+
+    rows = []
+    for checkpoint in sorted({c for c in checkpoints if c < time_budget} | {time_budget}):
+        lns_best = min(entry["Ziel"] for entry in log if entry["Zeit [s]"] <= checkpoint or entry["Iteration"] == 0)
+        mip_best = min((incumbent for elapsed, incumbent in trace if elapsed <= checkpoint), default=None)
+        rows.append([checkpoint, lns_best, mip_best])
+    print(tabulate.tabulate(rows, headers=["Zeit [s]", "LNS", "model.optimize()"], tablefmt="grid", floatfmt=".1f"))
+    print(f"LNS: {len(log) - 1} Iterationen, Verbesserung je Sekunde {log[-1]['Verbesserung je s']:.2f}; "
+          f"model.optimize(): Gap {model.MIPGap if model.SolCount > 0 else None}")
+    model.dispose()
+    return schedule, log
+
+
+if __name__ == "__main__":
+    gp.setParam("OutputFlag", 0)
+    compare_with_optimize(instance, time_budget=10, workers=2)
@@ -0,0 +1,216 @@
+import contextlib
+import time
+
+import gurobipy as gp
+from gurobipy import GRB
+import numpy as np
+import scipy.sparse as sp
+
+from time_indexed_model import build_model, operation_table
+
+
+# Zulässige Startvariablen als flache NumPy-Arrays (gleiche Zeitfenster wie build_start_index).
+# Für jede Variable i: Job, Maschine, Arbeitsgang (step = Index in job_process_order[j]), Technologie, Startperiode,
+# Index des Arbeitsgangs in der Eignungstabelle (operation) und belegte Dauer.
+# Die Blöcke (Arbeitsgang, Maschine) stammen aus operation_table, die Startperioden werden vektorisiert erzeugt.
+def start_index_arrays(instance, time_period):
+    table = operation_table(instance, time_period)
+    block_operation = table["pair_operation"]
+    block_release = table["pair_earliest"]
+    block_length = table["latest"][block_operation] - block_release + 1
+
+    n = int(block_length.sum())
+    block_offset = np.repeat(np.cumsum(block_length) - block_length, block_length)
+    operation = np.repeat(block_operation, block_length)
+    starts = {"operation": operation,
+              "job": table["job"][operation],
+              "machine": np.repeat(table["pair_machine"], block_length),
+              "step": table["step"][operation],
+              "tech": table["technology"][operation],
+              "t": np.repeat(block_release, block_length) + np.arange(n) - block_offset,
+              "duration": table["duration"][operation]}
+    return table, starts
+
+
+# Laufindex 0 .. length-1 innerhalb jedes Blocks, für alle Blöcke hintereinander
+def _ranges(lengths):
+    return np.arange(int(lengths.sum())) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+
+# Zeitindiziertes Modell über die Matrix-Schnittstelle (MVar + addMConstr) aufbauen.
+# Mit den Voreinstellungen liefert es dasselbe Modell wie build_model: gleiche Zeilen, gleiche Koeffizienten,
+# gleiche Zielfunktion. Stärkere LP-Relaxation (gleiche ganzzahlige Lösungen):
+#   capacity="clique":         zusätzlich je Job und Periode höchstens ein laufender Arbeitsgang (über alle Maschinen)
+#   precedence="disaggregated": Maschinenfolge je Periode tau statt einer Summenzeile je Arbeitsgang:
+#                               sum_{t <= tau} x[i, t] <= sum_{t + d_prev <= tau} x[i-1, t]
+#                               und Cmax je letztem Arbeitsgang eines Jobs über alle Maschinen summiert
+# profiler (profiling.Profiler) misst die Dauer von Variablenindex, Variablen und jeder Nebenbedingungsfamilie.
+def build_model_matrix(instance, time_period, weights=(1, 1, 1), capacity="period", precedence="aggregated", profiler=None):
+    machine_energy_consumption = instance["machine_energy_consumption"]
+    phase = profiler.phase if profiler is not None else lambda name: contextlib.nullcontext()
+
+    with phase("Variablenindex (Zeitfenster)"):
+        steps, starts = start_index_arrays(instance, time_period)
+    n = len(starts["t"])
+    n_steps = len(steps["job"])
+    columns = np.arange(n)
+    step, machine, t, duration = starts["operation"], starts["machine"], starts["t"], starts["duration"]
+
+    with phase("Variablen"):
+        model = gp.Model("JobScheduling")
+        x = model.addMVar(n, vtype=GRB.BINARY, name="x")
+        Cmax = model.addVar(vtype=GRB.INTEGER, name="Cmax")
+
+    with phase("assign"):
+        # (1) Jeder Prozessschritt startet genau einmal
+        A_assign = sp.csr_matrix((np.ones(n), (step, columns)), shape=(n_steps, n))
+        model.addMConstr(A_assign, x, "=", np.ones(n_steps), name="assign")
+
+    with phase("conflict"):
+        # (2) Maschinenkonflikte: jede Variable belegt die Perioden t .. t+duration-1 ihrer Maschine
+        occupied_var = np.repeat(columns, duration)
+        occupied_offset = np.arange(len(occupied_var)) - np.repeat(np.cumsum(duration) - duration, duration)
+        occupied_period = t[occupied_var] + occupied_offset
+        horizon = len(time_period)
+        keys, rows = np.unique(machine[occupied_var]*horizon + occupied_period, return_inverse=True)
+        # Perioden, in denen nur Starts eines einzigen Arbeitsgangs die Maschine belegen, brauchen keine Nebenbedingung
+        # (Vergleich mit einem beliebigen Arbeitsgang der Periode als Vertreter)
+        representative = np.zeros(len(keys), dtype=np.int64)
+        representative[rows] = step[occupied_var]
+        keep = np.zeros(len(keys), dtype=bool)
+        keep[rows[step[occupied_var] != representative[rows]]] = True
+        row_id = np.cumsum(keep) - 1
+        mask = keep[rows]
+        n_conflict = int(keep.sum())
+        A_conflict = sp.csr_matrix((np.ones(int(mask.sum())), (row_id[rows[mask]], occupied_var[mask])), shape=(n_conflict, n))
+        model.addMConstr(A_conflict, x, "<", np.ones(n_conflict), name="conflict")
+
+    if capacity == "clique":
+        with phase("clique"):
+            # Ein Job belegt je Periode höchstens eine Maschine; wie bei conflict nur Perioden mit mehreren Arbeitsgängen
+            job_keys, job_rows = np.unique(starts["job"][occupied_var]*horizon + occupied_period, return_inverse=True)
+            representative = np.zeros(len(job_keys), dtype=np.int64)
+            representative[job_rows] = step[occupied_var]
+            keep = np.zeros(len(job_keys), dtype=bool)
+            keep[job_rows[step[occupied_var] != representative[job_rows]]] = True
+            row_id = np.cumsum(keep) - 1
+            mask = keep[job_rows]
+            n_clique = int(keep.sum())
+            A_clique = sp.csr_matrix((np.ones(int(mask.sum())), (row_id[job_rows[mask]], occupied_var[mask])), shape=(n_clique, n))
+            model.addMConstr(A_clique, x, "<", np.ones(n_clique), name="clique")
+    elif capacity != "period":
+        raise ValueError(f"Unbekannte Kapazitätsformulierung: {capacity}")
+
+    with phase("sequence"):
+        # Variablen eines Schrittes, dessen Nachfolger zum selben Job gehört, bzw. eines Schrittes mit Vorgänger
+        has_next = np.append(steps["has_prev"][1:], False)
+        prev_mask = has_next[step]
+        curr_mask = steps["has_prev"][step]
+        if precedence == "aggregated":
+            # (3) Maschinenfolge: sum (t + d_prev) x_prev - sum t x_curr <= 0, eine Zeile je Schritt mit Vorgänger
+            sequence_row = np.cumsum(steps["has_prev"]) - 1
+            n_sequence = int(steps["has_prev"].sum())
+            A_sequence = sp.csr_matrix(
+                (np.concatenate([(t + duration)[prev_mask], -t[curr_mask]]),
+                 (np.concatenate([sequence_row[step[prev_mask] + 1], sequence_row[step[curr_mask]]]),
+                  np.concatenate([columns[prev_mask], columns[curr_mask]]))),
+                shape=(n_sequence, n))
+            model.addMConstr(A_sequence, x, "<", np.zeros(n_sequence), name="sequence")
+        elif precedence == "disaggregated":
+            # (3) Maschinenfolge je Periode: eine Zeile (i, tau) für jeden Arbeitsgang i mit Vorgänger und jedes tau
+            # in seinem Zeitfenster. Eine Variable von i mit Start t steht in allen Zeilen tau >= t, eine Variable
+            # des Vorgängers mit Ende e in allen Zeilen tau >= e.
+            earliest, latest = steps["earliest"], steps["latest"]
+            n_tau = np.where(steps["has_prev"], np.maximum(latest - earliest + 1, 0), 0)
+            row_offset = np.cumsum(n_tau) - n_tau
+            n_sequence = int(n_tau.sum())
+            curr = columns[curr_mask]
+            op = step[curr]
+            curr_count = latest[op] - t[curr] + 1
+            curr_rows = np.repeat(row_offset[op] + t[curr] - earliest[op], curr_count) + _ranges(curr_count)
+            prev = columns[prev_mask]
+            op = step[prev] + 1
+            begin = np.maximum(t[prev] + duration[prev], earliest[op])
+            prev_count = np.maximum(latest[op] - begin + 1, 0)
+            prev_rows = np.repeat(row_offset[op] + begin - earliest[op], prev_count) + _ranges(prev_count)
+            A_sequence = sp.csr_matrix(
+                (np.concatenate([np.ones(len(curr_rows)), -np.ones(len(prev_rows))]),
+                 (np.concatenate([curr_rows, prev_rows]), np.concatenate([np.repeat(curr, curr_count), np.repeat(prev, prev_count)]))),
+                shape=(n_sequence, n))
+            model.addMConstr(A_sequence, x, "<", np.zeros(n_sequence), name="sequence")
+        else:
+            raise ValueError(f"Unbekannte Formulierung der Maschinenfolge: {precedence}")
+
+    with phase("cmax"):
+        if precedence == "aggregated":
+            # (7) Cmax: sum (t + d) x[j, m, step, .] - Cmax <= 0 für jedes Tupel (Arbeitsgang, Maschine)
+            cmax_columns = columns
+            pairs, cmax_row = np.unique(step*(machine.max(initial=0) + 1) + machine, return_inverse=True)
+        else:
+            # (7) Cmax: Ende des letzten Arbeitsgangs je Job, über alle Maschinen summiert; die Enden der übrigen
+            # Arbeitsgänge sind über die Maschinenfolge beschränkt
+            cmax_columns = columns[~has_next[step]]
+            pairs, cmax_row = np.unique(step[cmax_columns], return_inverse=True)
+        n_cmax = len(pairs)
+        A_cmax = sp.csr_matrix(((t + duration)[cmax_columns], (cmax_row, cmax_columns)), shape=(n_cmax, n))
+        A_cmax = sp.hstack([A_cmax, sp.csr_matrix(-np.ones((n_cmax, 1)))], format="csr")
+        model.addMConstr(A_cmax, gp.hstack((x, gp.MVar.fromvar(Cmax))), "<", np.zeros(n_cmax), name="cmax")
+
+    with phase("Zielfunktion"):
+        # Zielfunktion: weights[0]*Cmax + weights[1]*energy_consumed + weights[2]*Jmax
+        energy = np.zeros(machine.max(initial=0) + 1)
+        for m, consumption in machine_energy_consumption.items():
+            if m < len(energy):
+                energy[m] = consumption
+        model.setObjective(weights[0]*Cmax + (weights[1]*energy[machine] + weights[2]*(t + duration)) @ x, GRB.MINIMIZE)
+
+    # Gleiche Schnittstelle wie build_model: x[j, m, step, t] -> Var
+    with phase("Schlüssel x[j, m, step, t]"):
+        start_index = gp.tuplelist(zip(starts["job"].tolist(), machine.tolist(), starts["step"].tolist(), t.tolist()))
+        x_by_key = gp.tupledict(zip(start_index, x.tolist()))
+    return model, x_by_key, start_index
+
+
+# Instanz vervielfachen, um größere Datensätze mit derselben Struktur zu erhalten
+def replicate_jobs(instance, factor):
+    jobs = instance["jobs"]
+    scaled = dict(instance)
+    scaled["jobs"] = [j + k*len(jobs) for k in range(factor) for j in jobs]
+    scaled["job_designations"] = {j + k*len(jobs): f"{instance['job_designations'][j]}_{k}" for k in range(factor) for j in jobs}
+    scaled["job_process_order"] = {j + k*len(jobs): instance["job_process_order"][j] for k in range(factor) for j in jobs}
+    scaled["job_quantity"] = {j + k*len(jobs): instance["job_quantity"][j] for k in range(factor) for j in jobs}
+    return scaled
+
+
+# Aufbauzeit von Schleifen- und Matrix-Modell auf denselben Daten vergleichen
+def compare_build_times(instance, horizons=(100, 200, 400), factors=(1, 4, 16)):
+    import tabulate
+
+    results = []
+    for factor in factors:
+        scaled = replicate_jobs(instance, factor)
+        for horizon in horizons:
+            row = [len(scaled["jobs"]), horizon]
+            sizes = []
+            for builder in (build_model, build_model_matrix):
+                start = time.perf_counter()
+                model, _, _ = builder(scaled, range(horizon))
+                model.update()
+                row.append(time.perf_counter() - start)
+                sizes.append((model.NumVars, model.NumConstrs, model.NumNZs))
+                model.dispose()
+            # Beide Wege müssen dasselbe Modell erzeugen
+            assert sizes[0] == sizes[1], sizes
+            row[2:2] = list(sizes[0])
+            row.append(row[-2] / row[-1])
+            results.append(row)
+    print(tabulate.tabulate(results, headers=["Jobs", "Horizont", "Variablen", "Nebenbed.", "Nichtnullen", "Schleifen [s]", "Matrix [s]", "Faktor"],
+                            tablefmt="grid", floatfmt=".3f"))
+    return results
+
+
+if __name__ == "__main__":
+    from optimization_algorithm import instance
+
+    gp.setParam("OutputFlag", 0)
+    compare_build_times(instance)
@@ -0,0 +1,97 @@
+# Mehrkriterielle Optimierung von Makespan und Energieverbrauch ohne Aufsummieren unterschiedlicher Einheiten.
+#   lexicographic_solve: Gurobi-Mehrzielmodell (setObjectiveN) mit Prioritäten und Toleranzen
+#   pareto_front:        Epsilon-Constraint-Verfahren (Cmax <= eps) auf einem einmal aufgebauten Modell;
+#                        eps steigt schrittweise, die vorige Lösung bleibt zulässig und dient als Startlösung.
+import time
+
+import gurobipy as gp
+from gurobipy import GRB
+import tabulate
+
+from dispatching import dispatch, schedule_metrics, warm_start
+from matrix_model import build_model_matrix
+from optimization_algorithm import instance, planning_horizon
+from time_indexed_model import extract_schedule
+
+
+# Zeitindiziertes Modell einmal aufbauen und die Kriterien als Ausdrücke bereitstellen
+def build_objectives(instance, time_period):
+    model, x, start_index = build_model_matrix(instance, time_period)
+    model.update()
+    energy = instance["machine_energy_consumption"]
+    job_process_order = instance["job_process_order"]
+    job_quantity = instance["job_quantity"]
+    keys = list(x.keys())
+    variables = list(x.values())
+    objectives = {"makespan": gp.LinExpr(model.getVarByName("Cmax")),
+                  "energy": gp.LinExpr([energy[m] for _, m, _, _ in keys], variables),
+                  "completion": gp.LinExpr([t + job_process_order[j][step][1]*job_quantity[j] for j, _, step, t in keys], variables)}
+    return model, x, objectives
+
+
+# Kriterien in der Reihenfolge von order als hierarchische Ziele setzen (höchste Priorität zuerst).
+# reltol erlaubt dem jeweiligen Kriterium, sich zugunsten der nachrangigen um diesen Anteil zu verschlechtern.
+# Die Ziele 0..n-1 werden überschrieben, damit dasselbe Modell ohne Neuaufbau umsortiert werden kann.
+def set_hierarchical_objectives(model, objectives, order, reltol=None):
+    for index, name in enumerate(order):
+        model.setObjectiveN(objectives[name], index=index, priority=len(order) - index,
+                            reltol=(reltol or {}).get(name, 0), name=name)
+    model.ModelSense = GRB.MINIMIZE
+
+
+def lexicographic_solve(instance, order=("makespan", "energy", "completion"), reltol=None, time_period=None, time_limit=60):
+    time_period = time_period or planning_horizon(instance)
+    model, x, objectives = build_objectives(instance, time_period)
+    set_hierarchical_objectives(model, objectives, order, reltol)
+    warm_start(model, x, dispatch(instance))
+    model.Params.TimeLimit = time_limit
+    model.optimize()
+    return model, extract_schedule(model, instance, x) if model.SolCount > 0 else None
+
+
+# Nicht dominierte Front Makespan vs. Energie. Erster Punkt: minimaler Makespan (danach minimale Energie).
+# Dann wird Cmax <= eps für eps = Makespan + 1, + 2, ... gelockert und jeweils die Energie minimiert
+# (bei Gleichstand der Makespan, danach die Summe der Endzeiten), bis die minimale Energie erreicht ist.
+def pareto_front(instance, time_period=None, time_limit_per_point=30):
+    time_period = time_period or planning_horizon(instance)
+    model, x, objectives = build_objectives(instance, time_period)
+    model.Params.TimeLimit = time_limit_per_point
+    Cmax = model.getVarByName("Cmax")
+
+    # Untere Schranke für die Energie: Energie zuerst minimieren
+    set_hierarchical_objectives(model, objectives, ("energy", "makespan", "completion"))
+    warm_start(model, x, dispatch(instance))
+    model.optimize()
+    model.Params.ObjNumber = 0
+    min_energy = model.ObjNVal if model.SolCount > 0 else None
+
+    set_hierarchical_objectives(model, objectives, ("makespan", "energy", "completion"))
+    model.optimize()
+    front = []
+    epsilon = model.addConstr(Cmax <= len(time_period), name="epsilon_cmax")
+    set_hierarchical_objectives(model, objectives, ("energy", "makespan", "completion"))
+    eps = round(Cmax.X)
+    while model.SolCount > 0:
+        schedule = extract_schedule(model, instance, x)
+        metrics = schedule_metrics(instance, schedule)
+        if not front or metrics["energy"] < front[-1]["energy"]:
+            front.append({"makespan": metrics["makespan"], "energy": metrics["energy"], "schedule": schedule,
+                          "runtime": model.Runtime})
+        if metrics["energy"] <= min_energy or eps >= len(time_period):
+            break
+        # Die bisherige Lösung bleibt bei gelockerter Schranke zulässig und wird als Startlösung übernommen
+        model.setAttr("Start", list(x.values()), model.getAttr("X", list(x.values())))
+        Cmax.Start = Cmax.X
+        eps = max(eps + 1, metrics["makespan"] + 1)
+        epsilon.RHS = eps
+        model.optimize()
+    return front
+
+
+if __name__ == "__main__":
+    gp.setParam("OutputFlag", 0)
+    start = time.perf_counter()
+    front = pareto_front(instance)
+    print(tabulate.tabulate([[point["makespan"], point["energy"], point["runtime"]] for point in front],
+                            headers=["Makespan", "Energie", "Zeit [s]"], tablefmt="grid", floatfmt=".3f"))
+    print(f"{len(front)} Punkte der Front in {time.perf_counter() - start:.2f} s (ein Modellaufbau)")
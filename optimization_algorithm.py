@@ -1,8 +1,14 @@
+import contextlib
+import itertools
+import math
+import sys
+
 import gurobipy as gp
 from gurobipy import GRB
-import pandas as pd
-import tabulate
-import plotly.figure_factory as ff
+
+from dispatching import dispatch, list_schedule, machine_rules, makespan, priority_rules, warm_start
+from instance_io import load_instance
+from time_indexed_model import build_model, extract_schedule, window_statistics
 
 machines = [0, 1, 2, 3, 4, 5, 6]
 machine_designations = {0: "EXAPT-CAM 1",   #CAM Vorbereitung
@@ -31,13 +37,14 @@ technology_allocation = {0: [0, 1],
 
 jobs = [0, 1, 2, 3, 4, 5, 6]
 job_designations = {0:"Prod0", 1:"Prod1", 2:"Prod2", 3:"Prod3", 4:"Prod4", 5:"Prod5", 6:"Prod6"}
-job_process_order = {0: {0: 1, 1: 3, 2: 3},    # Job 0 muss für eine Zeiteinheit an Technologie 0, dann für drei Zeiteinheiten an Technologie 1,...
-                  1: {1: 3, 2: 3},
-                  2: {0: 3, 2: 3},
-                  3: {1: 1, 2: 3, 2: 5},
-                  4: {0: 1, 2: 3},
-                  5: {1: 1, 2: 4},
-                  6: {0: 6, 2: 6, 1: 6}}
+# Arbeitspläne: je Job die geordnete Liste der Arbeitsgänge (Technologie, Dauer). Eine Technologie darf mehrfach vorkommen.
+job_process_order = {0: [(0, 1), (1, 3), (2, 3)],    # Job 0 muss für eine Zeiteinheit an Technologie 0, dann für drei Zeiteinheiten an Technologie 1,...
+                     1: [(1, 3), (2, 3)],
+                     2: [(0, 3), (2, 3)],
+                     3: [(1, 1), (2, 3), (2, 5)],
+                     4: [(0, 1), (2, 3)],
+                     5: [(1, 1), (2, 4)],
+                     6: [(0, 6), (2, 6), (1, 6)]}
 job_quantity = {0: 1, 1: 1, 2: 1, 3: 1, 4: 1, 5: 1, 6: 1}
 # jobs = [0, 1, 2]  # Jobs
 # machines = [0, 1, 2]      # Maschinen
@@ -46,239 +53,195 @@ job_quantity = {0: 1, 1: 1, 2: 1, 3: 1, 4: 1, 5: 1, 6: 1}
 #     (1, 0): 5, (1, 1): 2, (1, 2): 2,
 #     (2, 0): 2, (2, 1): 6, (2, 2): 0
 # }
-time_period = range(100)
-
-# Initialisiere das Modell
-model = gp.Model("JobScheduling")
-
-
-# # Setze PoolSearchMode auf 2, um mehrere Lösungen zu finden
-# model.setParam(GRB.Param.PoolSearchMode, 2)
-
-# # Setze die maximale Anzahl von Lösungen, die im Pool gespeichert werden sollen
-# model.setParam(GRB.Param.PoolSolutions, 10)
-
-# Variablen: Startzeiten x_ij
-x = model.addVars(jobs, machines, technologies, time_period, vtype=GRB.BINARY, name="x")
-
-# Cmax Variable (für makespan)
-Cmax = model.addVar(vtype=GRB.INTEGER, name="Cmax")
-Jmax = model.addVar(vtype=GRB.INTEGER, name="Jmax")
-energy_consumed = model.addVar(vtype=GRB.INTEGER, name="energy_consumed")
-# penalty = model.addVar(vtype=GRB.INTEGER, name="penalty")
-
-# Variable k: Ganze Zahl, gibt wieder wie oft ein Produktionsschritt erledigt wurde
-# k = model.addVars(jobs, machines, vtype=GRB.INTEGER, name="k")
-# for j in jobs:
-#     for m in machines:
-#         model.addConstr(k[j, m] >= 1)
-
-# (1) Jeder Job startet nur einmal auf einer Maschine
-for j in jobs: 
-     for tech in job_process_order[j].keys():
-        # model.addConstr((gp.quicksum(x[j, m, tech, t] for m in technology_allocation[tech] for t in time_period) >= job_quantity[j]), name=f"assign_{j}_{tech}")
-        model.addConstr((gp.quicksum(x[j, m, tech, t] for m in technology_allocation[tech] for t in time_period) == 1), name=f"assign_{j}_{tech}")
-        # for m in technology_allocation[tech]:
-        #     model.addConstr((gp.quicksum(x[j, m, tech, t] for t in time_period) >= job_quantity[j]), name=f"assign_{j}_{tech}")
-
-# (2) Maschine kann zur gleichen Zeit nur einen Job bearbeiten
-for m in machines:
-    for t in time_period:
-        # Summiere alle Jobs, die diese Maschine zum Zeitpunkt t nutzen könnten
-        model.addConstr(
-            (
-                gp.quicksum(
-                    x[j, m, tech, t_prime]
-                    for j in jobs
-                    for tech, duration in job_process_order[j].items()
-                    if m in technology_allocation[tech]  # Prüft, ob Maschine für die Technologie verfügbar ist
-                    for t_prime in range(max(0, t - (duration*job_quantity[j]) + 1), t + 1)
-                )
-            ) <= 1,
-            name=f"conflict_{m}_{t}"
-        )
-
-# (3) Maschinenfolge der Jobs einhalten
-for j in jobs:
-    # Iteriere über die Prozesse (Technologien) in der Reihenfolge ihrer Bearbeitung
-    process_steps = list(job_process_order[j].items())
-    
-    for idx in range(1, len(process_steps)):
-        # Aktueller und vorheriger Prozessschritt (Technologie und Dauer)
-        tech_prev, duration_prev = process_steps[idx - 1]
-        tech_curr, duration_curr = process_steps[idx]
-        
-        # Maschinen, die der aktuellen und vorherigen Technologie zugeordnet sind
-        machines_prev = technology_allocation[tech_prev]
-        machines_curr = technology_allocation[tech_curr]
-        
-        model.addConstr(
-                    (
-                        gp.quicksum((t + (duration_prev*job_quantity[j])) * x[j, m_prev, tech_prev, t]  for m_prev in machines_prev for t in time_period) 
-                        <= gp.quicksum(t * x[j, m_curr, tech_curr, t]  for m_curr in machines_curr for t in time_period)
-                    ),
-                    name=f"Sequence. Job: {j}; tech_jetzt:{tech_curr}"
-                )
-
-#         # Erstellen der Nebenbedingungen für die Maschinenfolge
-        # for m_prev in machines_prev:
-        #     for m_curr in machines_curr:
-        #         model.addConstr(
-        #             (
-        #                 gp.quicksum((t + duration_prev - 1) * x[j, m_prev, tech_prev, t]  for t in time_period) 
-        #                 <= gp.quicksum(t * x[j, m_curr, tech_curr, t] - 1 for t in time_period)
-        #             ),
-        #             name=f"Sequence. Job: {j}; m_vorher:{m_prev}; tech_vorher:{tech_prev}; m_jetzt{m_curr}; tech_jetzt:{tech_curr}"
-        #         )
-
-# penalty = gp.quicksum(x[j, m, tech, t] for j in jobs for tech in job_process_order[j].keys() for m in technology_allocation[tech] for t in time_period)
-
-# (5) Letzter Job an einer Maschine darf nicht später starten als die benötigte Produktionsdauer.
-# for j in jobs:
-#     for tech, duration in job_process_order[j].items():
-#         for m in technology_allocation[tech]:
-#             model.addConstr(
-#                 gp.quicksum(x[j, m, tech, t] for t in range(len(time_period) - duration + 1, len(time_period))) == 0,
-#                 name=f"latest_start_{j}_{m}"
-#             )
-
-# (7) Bearbeitungsdauer soll min. so lang sein wie der letzte Prozessschritt mit der längsten Prozessdauer
-# Nur für Cmax relevant
-for j in jobs:
-    for tech, duration in job_process_order[j].items():
-        for m in technology_allocation[tech]:
-            model.addConstr(
-                (gp.quicksum((t + (duration*job_quantity[j])) * x[j, m, tech, t] for t in time_period)) <= Cmax, 
-                name=f"cmax_{j}_{m}"
-            )
-
-# Gesamte Dauer die benötigt wird um alle Schritte in einem Job zu erledigen
-# for j in jobs: 
-#     model.addConstr(
-#                 (gp.quicksum((t + (duration*job_quantity[j])) * x[j, m, tech, t] for tech, duration in job_process_order[j].items() for m in technology_allocation[tech] for t in time_period)) <= Jmax, 
-#                 name=f"jmax_{j}_{m}"
-#             )
-# for j in jobs: 
-#     for tech, duration in job_process_order[j].items():
-#         model.addConstr(
-#                     (gp.quicksum((t + (duration*job_quantity[j])) * x[j, m, tech, t] for m in technology_allocation[tech] for t in time_period)) <= Jmax, 
-#                     name=f"jmax_{j}_{m}"
-#                 )
 
-# Wenn Summe über alles gebildet wird, dann werden die Jobs so schnell wie möglich erledigt, aber die Gesamtdauer alle Jobs zu erledigen steigt. 
-# Im Vergleich zu der Herangehensweise eins drüber
-Jmax = gp.quicksum((t + (duration*job_quantity[j])) * x[j, m, tech, t] for j in jobs for tech, duration in job_process_order[j].items() for m in technology_allocation[tech] for t in time_period)
-
-# switch_amount = gp.quicksum(x[j, m, tech, t] for j in jobs for m in machines for tech in technologies for t in time_period)
-
-energy_consumed = gp.quicksum(x[j, m, tech, t]*machine_energy_consumption[m] for j in jobs for tech in job_process_order[j] for m in technology_allocation[tech] for t in time_period)
-
-# model.setObjective(Cmax, GRB.MINIMIZE)
-# model.setObjective(Cmax + energy_consumed, GRB.MINIMIZE)
-# model.setObjective(energy_consumed, GRB.MINIMIZE)
-model.setObjective(Cmax + energy_consumed + Jmax, GRB.MINIMIZE) 
-# model.setObjective(Cmax + energy_consumed + 1000*penalty, GRB.MINIMIZE)
-# model.setObjective(Cmax + energy_consumed + 10*switch_amount, GRB.MINIMIZE)
-# model.setObjective(Cmax + switch_amount, GRB.MINIMIZE)
-
-model.Params.TimeLimit = 60
-
-# Optimierung durchführen
-model.optimize()
-
-# Wenn das Modell unlösbar ist, fordere das IIS an
-if model.status == GRB.INFEASIBLE:
-    print("Das Modell ist unlösbar. Berechne IIS...")
-    model.computeIIS()  # Berechnet das IIS (Irreducible Inconsistent Subsystem)
-    model.write("infeasible.ilp")  # Speichert die IIS-Beschränkungen in einer Datei
-    
-    # Ausgabe der unlösbaren Constraints
-    print("\nDie folgenden Constraints sind Teil des IIS (Irreducible Inconsistent Subsystem):")
-    for c in model.getConstrs():
-        if c.IISConstr:
-            print(f"{c.constrName}")
-else:
-    # Falls eine optimale Lösung gefunden wurde
-    # if model.status == GRB.OPTIMAL:
-
-        # print(f"Strafe: {penalty}")
-    
-        table_data = []
-    
-        for j in jobs:
-            for tech, duration in job_process_order[j].items():
-                for m in technology_allocation[tech]:
-                    for t in time_period:
-                        if x[j, m, tech, t].X > 0.5:
-                            start_time = t
-                            end_time = t + duration  
-                            machine_name = machine_designations[m]
-                            tech_name = technology_designations[tech]
-                            
-                            # Daten für die Tabelle
-                            table_data.append([f"Job {j}", machine_name, tech_name, start_time, end_time])
-                            
-
-        # Ergebnis-Tabelle speichern und anzeigen
-        print(tabulate.tabulate(table_data, headers=["Job", "Machine", "Technology", "Start", "End"], tablefmt="grid"))
-    
-
-        # for m in machines:
-            
-        #     # Tabellentitel: Zeitperioden als Spalten
-        #     headers = ["Job \\ Zeit"] + [f"T{t}" for t in time_period]
-
-        #     # Liste für die Tabellendaten
-        #     table = []
-
-        #     # Durchlaufe alle Jobs und fülle die Tabelle
-        #     for j in jobs:
-        #         # Zeilenkopf: Job-Name
-        #         row = [f"Job {job_designations[j]}"]
-        #         for tech in job_process_order.keys():
-        #             for t in time_period:
-        #                 if x[j, m, tech, t].X > 0.5:  # Wenn die Startzeit für diesen Job in dieser Zeitperiode ist
-        #                     row.append(1)  # Job läuft in dieser Zeitperiode
-        #                 else:
-        #                     row.append(0)  # Job läuft nicht in dieser Zeitperiode
-        #             table.append(row)
-            
-        #     # Ausgabe der Tabelle mit tabulate
-        #     # print(tabulate.tabulate(table, headers, tablefmt="grid"))
-        #     with open(machine_designations[m], 'w') as f:
-        #         f.write(tabulate.tabulate(table, headers, tablefmt="grid"))
-        
-        data_for_gantt = []
-
-        # # Iteriere über alle Jobs und Technologien
-        for j in jobs:
-            for tech, duration in job_process_order[j].items():  # Für jede Technologie und ihre Dauer im Job
-                # Maschinenliste für die aktuelle Technologie abrufen
-                machines_for_tech = technology_allocation[tech]
-                
-                for t in time_period:
-                    # Gehe über die Maschinen, die dieser Technologie zugeordnet sind
-                    for m in machines_for_tech:
-                        # Prüfen, ob die Variable x[j, m, t] den Wert 1 hat (Job j startet auf Maschine m bei Zeit t)
-                        if x[j, m, tech, t].X > 0.5:
-                            # Aufgabe für das Gantt-Diagramm erstellen
-                            task = {
-                                "Task": f"{machine_designations[m]}",
-                                "Start": t,
-                                "Finish": t + duration*job_quantity[j],
-                                # "Resource": f"{job_designations[j]} - {technology_designations[tech]}"
-                                "Resource": f"{job_designations[j]}"
-                            }
-                            data_for_gantt.append(task)
-
-        # DataFrame zur Darstellung im Gantt-Diagramm erstellen
-        df = pd.DataFrame(data=data_for_gantt, columns=["Task", "Start", "Finish", "Resource"])
-
-        # Gantt-Diagramm erstellen
-        fig = ff.create_gantt(df, index_col='Resource', bar_width=0.4, show_colorbar=True, group_tasks=True, showgrid_x=True)
-        fig.update_layout(xaxis_type='linear')
-        fig.update_traces(mode='lines', line_color='black', selector=dict(fill='toself'))
-        fig.show()
+# Länge einer Zeitperiode des Modells in Zeiteinheiten der Daten (z. B. 15 für 15-Minuten-Slots bei Minutenangaben)
+time_bucket = 1
+# Der Planungshorizont ergibt sich aus dem Makespan der Greedy-Listenplanung mal diesem Faktor
+horizon_slack = 1.2
+
+# Alle Daten einer Planungsinstanz, so wie sie von den Modellbausteinen erwartet werden
+instance = {"machines": machines,
+            "machine_designations": machine_designations,
+            "machine_energy_consumption": machine_energy_consumption,
+            "technologies": technologies,
+            "technology_designations": technology_designations,
+            "technology_allocation": technology_allocation,
+            "jobs": jobs,
+            "job_designations": job_designations,
+            "job_process_order": job_process_order,
+            "job_quantity": job_quantity}
+
+# Auswahl des Modellaufbaus: "loops" (quicksum-Schleifen) oder "matrix" (NumPy/SciPy, siehe matrix_model.py)
+model_builder = "matrix"
+# Modellformulierung: "time_indexed" oder "disjunctive" (siehe disjunctive_model.py)
+formulation = "time_indexed"
+# Stärkere LP-Relaxation des zeitindizierten Modells (nur Matrix-Aufbau, siehe build_model_matrix):
+# Kapazität "period" oder "clique", Maschinenfolge "aggregated" oder "disaggregated"
+capacity_constraints = "period"
+precedence_constraints = "aggregated"
+# Schneller Modus: nur Prioritätsregeln (dispatching.py), kein Solver. Wird auch ohne Gurobi-Lizenz verwendet.
+fast_mode = False
+# Gewichte der Zielfunktion für (Cmax, energy_consumed, Jmax)
+objective_weights = (1, 1, 1)
+# Bericht (siehe report.py): Verzeichnis und Formate; show_plot öffnet zusätzlich das Gantt-Diagramm im Browser
+report_dir = "report"
+report_formats = ("html", "csv", "timelines")
+show_plot = False
+
+
+# Instanz auf ein gröberes Zeitraster umrechnen. Die Bearbeitungsdauer eines Schrittes
+# (Dauer * Stückzahl) wird auf ganze Zeitperioden aufgerundet, die Stückzahl ist danach in der Dauer enthalten.
+# Freigabe- und Verfügbarkeitszeiten werden aufgerundet (nie zu früh), Fälligkeiten abgerundet (nie zu spät).
+def bucket_instance(instance, time_bucket):
+    if time_bucket == 1:
+        return instance
+    job_quantity = instance["job_quantity"]
+    bucketed = dict(instance)
+    bucketed["job_process_order"] = {j: [(tech, -(-duration*job_quantity[j] // time_bucket)) for tech, duration in steps]
+                                     for j, steps in instance["job_process_order"].items()}
+    bucketed["job_quantity"] = {j: 1 for j in job_quantity}
+    for key in ("job_release", "machine_available"):
+        if key in instance:
+            bucketed[key] = {k: -(-value // time_bucket) for k, value in instance[key].items()}
+    if "job_due_date" in instance:
+        bucketed["job_due_date"] = {j: value // time_bucket for j, value in instance["job_due_date"].items()}
+    bucketed["time_bucket"] = instance.get("time_bucket", 1)*time_bucket
+    return bucketed
+
+
+# Planungshorizont als heuristische Obergrenze: größter Makespan der Ablaufpläne aller Kombinationen aus Prioritätsregel
+# und Maschinenwahl (dispatching.py) mal slack. Jeder dieser Pläne passt hinein, das Modell ist also nie unlösbar und
+# die Startlösung aus dispatch() liegt immer im Horizont. Eine Schranke für das Optimum ist das nicht: Wegen des
+# Energieanteils im Ziel kann ein noch längerer Plan besser sein und wird abgeschnitten (größeres slack gibt mehr Raum).
+def planning_horizon(instance, slack=horizon_slack):
+    longest = max(makespan(list_schedule(instance, rule, machine_rule))
+                  for rule, machine_rule in itertools.product(priority_rules, machine_rules))
+    return range(max(1, math.ceil(longest*slack)))
+
+
+# Instanz mit dem gewählten Modell lösen und den Ablaufplan zurückgeben.
+#   formulation="time_indexed": zeitindiziertes Modell (build_model bzw. build_model_matrix)
+#   formulation="disjunctive":  Reihenfolgemodell mit stetigen Startzeiten (disjunctive_model.py)
+# Beide Modelle erhalten den Ablaufplan der Prioritätsregeln als Startlösung.
+# weights gewichtet (Cmax, energy_consumed, Jmax), params setzt zusätzliche Gurobi-Parameter,
+# capacity/precedence wählen die Formulierung des zeitindizierten Modells (Voreinstellung siehe oben).
+# Rückgabe: (Modell, Ablaufplan); der Ablaufplan ist None, wenn keine zulässige Lösung gefunden wurde.
+def solve(instance, formulation="time_indexed", time_period=None, time_limit=60, builder=None,
+          weights=objective_weights, params=None, capacity=None, precedence=None, profiler=None):
+    # Mit profiler (profiling.Profiler) wird jede Phase gemessen, die Modellgröße je Nebenbedingungsfamilie erfasst
+    # und der Optimierungsverlauf als Telemetrie geschrieben
+    phase = profiler.phase if profiler is not None else lambda name: contextlib.nullcontext()
+    if time_period is None:
+        time_period = planning_horizon(instance)
+    with phase("Prioritätsregeln"):
+        initial_schedule = dispatch(instance, weights=weights)
+    # Der Horizont muss die Startlösung enthalten, sonst beginnt der Solver ohne sie
+    if makespan(initial_schedule) > len(time_period):
+        time_period = range(makespan(initial_schedule))
+
+    if formulation == "disjunctive":
+        from disjunctive_model import build_disjunctive_model, extract_disjunctive_schedule, warm_start_disjunctive
+        with phase("Modellaufbau"):
+            model, variables = build_disjunctive_model(instance, time_period, weights)
+        with phase("Startlösung"):
+            warm_start_disjunctive(model, variables, initial_schedule)
+        extract = lambda: extract_disjunctive_schedule(model, variables)
+    elif formulation == "time_indexed":
+        capacity = capacity or capacity_constraints
+        precedence = precedence or precedence_constraints
+        if (builder or model_builder) == "matrix":
+            from matrix_model import build_model_matrix
+            # Der Matrix-Aufbau misst Variablen und jede Nebenbedingungsfamilie selbst
+            model, x, _ = build_model_matrix(instance, time_period, weights, capacity, precedence, profiler)
+        elif (capacity, precedence) != ("period", "aggregated"):
+            raise ValueError("Die stärkeren Formulierungen gibt es nur im Matrix-Aufbau (builder=\"matrix\")")
+        else:
+            with phase("Modellaufbau"):
+                model, x, _ = build_model(instance, time_period, weights)
+        with phase("Startlösung"):
+            warm_start(model, x, initial_schedule)
+        extract = lambda: extract_schedule(model, instance, x)
+    else:
+        raise ValueError(f"Unbekannte Formulierung: {formulation}")
+
+    with phase("Modell an Gurobi übergeben"):
+        model.update()
+    model.Params.TimeLimit = time_limit
+    # Weitere Gurobi-Parameter, z. B. {"Threads": 2}
+    for name, value in (params or {}).items():
+        model.setParam(name, value)
+
+    # Optimierung durchführen
+    if profiler is not None:
+        profiler.record_model(model)
+        profiler.optimize(model)
+    else:
+        model.optimize()
+
+    with phase("Auslesen"):
+        schedule = extract() if model.SolCount > 0 else None
+    return model, schedule
+
+
+# Ergebnis-Tabelle eines Ablaufplans ausgeben
+def print_schedule(instance, schedule):
+    import tabulate
+
+    time_bucket = instance.get("time_bucket", 1)
+    table_data = [[f"Job {entry['job']}", instance["machine_designations"][entry["machine"]],
+                   instance["technology_designations"][entry["technology"]],
+                   entry["start"]*time_bucket, entry["end"]*time_bucket]
+                  for entry in sorted(schedule, key=lambda entry: (entry["job"], entry["step"]))]
+    print(tabulate.tabulate(table_data, headers=["Job", "Machine", "Technology", "Start", "End"], tablefmt="grid"))
+
+
+# Ergebnis-Tabelle ausgeben und Gantt-Diagramm im Browser öffnen (interaktive Nutzung; ohne Browser siehe report.py)
+def show_results(instance, schedule):
+    from report import gantt_figure
+
+    print_schedule(instance, schedule)
+    gantt_figure(instance, schedule).show()
+
+
+if __name__ == "__main__":
+    # Optional: Instanz aus einer Datei bzw. einem Verzeichnis laden (siehe instance_io.py), sonst die Daten oben
+    if len(sys.argv) > 1:
+        instance = load_instance(sys.argv[1])
+    instance = bucket_instance(instance, time_bucket)
+    time_period = planning_horizon(instance)
+    print(f"Planungshorizont: {len(time_period)} Perioden zu je {time_bucket} Zeiteinheiten")
+    for name, (variables, terms) in window_statistics(instance, time_period).items():
+        print(f"  {name:17s} {variables:7d} Startvariablen, {terms:8d} Einträge in conflict-Zeilen")
+
+    if fast_mode:
+        schedule = dispatch(instance)
+    else:
+        try:
+            model, schedule = solve(instance, formulation, time_period)
+        except gp.GurobiError as e:
+            # Ohne (ausreichende) Lizenz bleibt der Ablaufplan der Prioritätsregeln
+            print(f"Gurobi nicht verfügbar ({e}), verwende den Ablaufplan der Prioritätsregeln.")
+            schedule = dispatch(instance)
+
+    # Wenn das Modell unlösbar ist, fordere das IIS an
+    if schedule is None and model.status == GRB.INFEASIBLE:
+        print("Das Modell ist unlösbar. Berechne IIS...")
+        model.computeIIS()  # Berechnet das IIS (Irreducible Inconsistent Subsystem)
+        model.write("infeasible.ilp")  # Speichert die IIS-Beschränkungen in einer Datei
+
+        # Ausgabe der unlösbaren Constraints
+        print("\nDie folgenden Constraints sind Teil des IIS (Irreducible Inconsistent Subsystem):")
+        for c in model.getConstrs():
+            if c.IISConstr:
+                print(f"{c.constrName}")
+    elif schedule is not None:
+        from report import export_report
+
+        print_schedule(instance, schedule)
+        paths = export_report(instance, schedule, report_dir, report_formats)
+        print(f"Bericht geschrieben: {len(paths)} Dateien in {report_dir}/")
+        if show_plot:
+            show_results(instance, schedule)
 
 """
 Modell 2 nicht benötigt da alles in Modell 1 abgedeckt ist.
@@ -0,0 +1,165 @@
+# Messung, wo die Zeit eines Planungslaufs bleibt: Dauer je Phase (Daten laden, Modellaufbau je Nebenbedingungsfamilie,
+# Optimierung, Auslesen, Bericht), Modellgröße je Familie und ein Verlauf von Zielfunktionswert, Schranke und Gap
+# während der Optimierung, der zeilenweise als JSON (JSON Lines) in eine Datei geschrieben wird.
+import contextlib
+import datetime
+import json
+import re
+import sys
+import time
+
+from gurobipy import GRB
+import numpy as np
+import tabulate
+
+telemetry_file = "telemetry.jsonl"
+
+
+# Familie einer Nebenbedingung bzw. Variablen aus ihrem Namen: "conflict[12]", "conflict_3_7" und
+# "Sequence. Job: 1; ..." ergeben "conflict" bzw. "Sequence"
+def family(name):
+    return re.split(r"[\[_.]", name, maxsplit=1)[0]
+
+
+# Zeilen und Nichtnullen je Nebenbedingungsfamilie sowie Spalten und Nichtnullen je Variablenfamilie
+def model_size_by_family(model):
+    model.update()
+    A = model.getA().tocsr()
+    row_nonzeros = np.diff(A.indptr)
+    column_nonzeros = np.diff(A.tocsc().indptr)
+    constraints, variables = {}, {}
+    for name, nonzeros in zip(model.getAttr("ConstrName", model.getConstrs()), row_nonzeros.tolist()):
+        size = constraints.setdefault(family(name), {"Zeilen": 0, "Nichtnullen": 0})
+        size["Zeilen"] += 1
+        size["Nichtnullen"] += nonzeros
+    for name, nonzeros in zip(model.getAttr("VarName", model.getVars()), column_nonzeros.tolist()):
+        size = variables.setdefault(family(name), {"Variablen": 0, "Nichtnullen": 0})
+        size["Variablen"] += 1
+        size["Nichtnullen"] += nonzeros
+    return constraints, variables
+
+
+# Telemetrie eines Laufs vorbereiten (vor model.optimize(telemetry_callback)). Die Datensätze sammelt der Callback in
+# model._records; mit file (offene Textdatei) werden sie zusätzlich als JSON-Zeilen geschrieben.
+def start_telemetry(model, file=None, run=None):
+    model._records, model._telemetry, model._run = [], file, run
+    model._presolve_end, model._last_progress = None, None
+
+
+# Callback: jede neue Lösung (MIPSOL) und jede Änderung von Zielfunktionswert oder Schranke (MIP) als Datensatz
+# aufzeichnen. Der erste Callback aus Simplex oder Branch-and-Bound markiert das Presolve-Ende (Näherung, Gurobi
+# meldet die Zeit nur im Log); sie steht danach in model._presolve_end.
+def telemetry_callback(model, where):
+    record = None
+    if model._presolve_end is None and where in (GRB.Callback.SIMPLEX, GRB.Callback.MIP, GRB.Callback.MIPNODE, GRB.Callback.BARRIER):
+        model._presolve_end = model.cbGet(GRB.Callback.RUNTIME)
+        record = {"event": "presolve_end"}
+    elif where == GRB.Callback.MIPSOL:
+        record = {"event": "mipsol", "incumbent": model.cbGet(GRB.Callback.MIPSOL_OBJ),
+                  "best": model.cbGet(GRB.Callback.MIPSOL_OBJBST), "bound": model.cbGet(GRB.Callback.MIPSOL_OBJBND),
+                  "nodes": model.cbGet(GRB.Callback.MIPSOL_NODCNT)}
+    elif where == GRB.Callback.MIP:
+        incumbent, bound = model.cbGet(GRB.Callback.MIP_OBJBST), model.cbGet(GRB.Callback.MIP_OBJBND)
+        if (incumbent, bound) != model._last_progress:
+            model._last_progress = (incumbent, bound)
+            record = {"event": "mip", "incumbent": incumbent, "bound": bound, "nodes": model.cbGet(GRB.Callback.MIP_NODCNT)}
+    if record is None:
+        return
+    incumbent = min(record.get("incumbent", GRB.INFINITY), record.get("best", GRB.INFINITY))
+    if incumbent < GRB.INFINITY and abs(record.get("bound", GRB.INFINITY)) < GRB.INFINITY and incumbent != 0:
+        record["gap"] = abs(incumbent - record["bound"])/abs(incumbent)
+    for key in ("incumbent", "best", "bound"):
+        # Keine Lösung bzw. Schranke: GRB.INFINITY (1e100) wird als null geschrieben
+        if key in record and abs(record[key]) >= GRB.INFINITY:
+            record[key] = None
+    record.update(run=model._run, elapsed=model.cbGet(GRB.Callback.RUNTIME))
+    model._records.append(record)
+    if model._telemetry is not None:
+        model._telemetry.write(json.dumps(record) + "\n")
+        model._telemetry.flush()
+
+
+# Verlauf [Zeit, Zielfunktionswert, Schranke, Gap] aus den MIP-Datensätzen der Telemetrie
+def gap_trace(records):
+    return [[record["elapsed"], record["incumbent"], record["bound"], record.get("gap")]
+            for record in records if record["event"] == "mip"]
+
+
+class Profiler:
+    # model_sizes=False: keine Modellgröße je Familie (erfordert eine Kopie der Koeffizientenmatrix)
+    def __init__(self, telemetry_file=telemetry_file, model_sizes=True):
+        self.telemetry_file = telemetry_file
+        self.model_sizes = model_sizes
+        self.run = datetime.datetime.now().isoformat(timespec="seconds")
+        self.phases = []
+        self.constraints, self.variables = {}, {}
+        self.presolve_time = None
+
+    # Dauer eines Abschnitts messen: with profiler.phase("Optimierung"): ...
+    @contextlib.contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append({"Phase": name, "Zeit [s]": time.perf_counter() - start})
+
+    def record_model(self, model):
+        if self.model_sizes:
+            with self.phase("Modellgröße je Familie"):
+                self.constraints, self.variables = model_size_by_family(model)
+
+    # model.optimize() mit Telemetrie; ohne telemetry_file wird nur die Zeit gemessen
+    def optimize(self, model):
+        with self.phase("Optimierung"):
+            if self.telemetry_file is None:
+                model.optimize()
+                return
+            with open(self.telemetry_file, "a") as f:
+                start_telemetry(model, f, self.run)
+                model.optimize(telemetry_callback)
+                # Abschlusszeile mit den bis hierhin gemessenen Phasen
+                summary = {"event": "summary", "run": self.run, "elapsed": model.Runtime, "status": model.Status,
+                           "incumbent": model.ObjVal if model.SolCount > 0 else None, "bound": model.ObjBound,
+                           "gap": model.MIPGap if model.SolCount > 0 else None, "nodes": model.NodeCount,
+                           "phases": self.phases}
+                f.write(json.dumps(summary) + "\n")
+        self.presolve_time = model._presolve_end
+
+    def print_report(self):
+        total = sum(phase["Zeit [s]"] for phase in self.phases)
+        rows = [[phase["Phase"], phase["Zeit [s]"], phase["Zeit [s]"]/total*100 if total else 0] for phase in self.phases]
+        if self.presolve_time is not None:
+            rows.append(["  davon Presolve (Gurobi)", self.presolve_time, self.presolve_time/total*100 if total else 0])
+        print(tabulate.tabulate(rows, headers=["Phase", "Zeit [s]", "Anteil [%]"], tablefmt="grid", floatfmt=".3f"))
+        if not self.constraints:
+            return
+        print(tabulate.tabulate([[name, size["Zeilen"], size["Nichtnullen"]] for name, size in self.constraints.items()],
+                                headers=["Nebenbedingungen", "Zeilen", "Nichtnullen"], tablefmt="grid"))
+        print(tabulate.tabulate([[name, size["Variablen"], size["Nichtnullen"]] for name, size in self.variables.items()],
+                                headers=["Variablen", "Anzahl", "Nichtnullen"], tablefmt="grid"))
+
+
+# Vollständiger Planungslauf mit Messung: Daten laden (Datei oder Beispieldaten), lösen, Bericht schreiben
+def profile_run(path=None, formulation="time_indexed", time_limit=60, telemetry_file=telemetry_file, plot=True):
+    from instance_io import load_instance
+    import optimization_algorithm
+
+    profiler = Profiler(telemetry_file)
+    with profiler.phase("Daten laden"):
+        instance = load_instance(path) if path else optimization_algorithm.instance
+        instance = optimization_algorithm.bucket_instance(instance, optimization_algorithm.time_bucket)
+    with profiler.phase("Planungshorizont"):
+        time_period = optimization_algorithm.planning_horizon(instance)
+    model, schedule = optimization_algorithm.solve(instance, formulation, time_period, time_limit, profiler=profiler)
+    if schedule is not None and plot:
+        from report import export_report
+
+        with profiler.phase("Bericht"):
+            export_report(instance, schedule, optimization_algorithm.report_dir, optimization_algorithm.report_formats)
+    profiler.print_report()
+    return profiler, schedule
+
+
+if __name__ == "__main__":
+    profile_run(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,112 @@
+# Berichtsausgabe eines Ablaufplans ohne Browser (z. B. auf dem Planungsserver):
+#   Gantt-Diagramm als HTML oder PNG, Ablaufplan als CSV oder Parquet, Belegung je Maschine als Textraster.
+# Alles wird direkt aus den Einträgen des Ablaufplans (Format aus dispatching.py) erzeugt. plotly, pandas und tabulate
+# werden erst importiert, wenn die jeweilige Ausgabe angefordert wird.
+import csv
+import os
+
+schedule_columns = ["job", "job_designation", "step", "technology", "technology_designation",
+                    "machine", "machine_designation", "start", "end"]
+
+
+# Einträge des Ablaufplans mit Bezeichnungen, in Zeiteinheiten der Daten (auch bei gröberem Zeitraster im Modell)
+def schedule_records(instance, schedule):
+    time_bucket = instance.get("time_bucket", 1)
+    return [{"job": entry["job"], "job_designation": instance["job_designations"][entry["job"]], "step": entry["step"],
+             "technology": entry["technology"], "technology_designation": instance["technology_designations"][entry["technology"]],
+             "machine": entry["machine"], "machine_designation": instance["machine_designations"][entry["machine"]],
+             "start": entry["start"]*time_bucket, "end": entry["end"]*time_bucket}
+            for entry in sorted(schedule, key=lambda entry: (entry["job"], entry["step"]))]
+
+
+# Ablaufplan als CSV (ohne Zusatzpakete) oder Parquet (pandas) schreiben, je nach Dateiendung
+def write_schedule(instance, schedule, path):
+    records = schedule_records(instance, schedule)
+    if path.endswith(".parquet"):
+        import pandas as pd
+
+        pd.DataFrame(records, columns=schedule_columns).to_parquet(path, index=False)
+    else:
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=schedule_columns)
+            writer.writeheader()
+            writer.writerows(records)
+    return path
+
+
+# Belegung einer Maschine als Raster: eine Zeile je Job, eine Spalte je Zeitperiode des Modells, 1 = Job läuft auf m
+def machine_timeline(instance, schedule, m):
+    import tabulate
+
+    entries = [entry for entry in schedule if entry["machine"] == m]
+    horizon = max((entry["end"] for entry in schedule), default=0)
+    rows = {}
+    for entry in entries:
+        row = rows.setdefault(entry["job"], [0]*horizon)
+        for t in range(entry["start"], entry["end"]):
+            row[t] = 1
+    headers = ["Job \\ Zeit"] + [f"T{t}" for t in range(horizon)]
+    table = [[f"Job {instance['job_designations'][j]}"] + row for j, row in sorted(rows.items())]
+    return tabulate.tabulate(table, headers, tablefmt="grid")
+
+
+# Belegungsraster aller Maschinen, eine Textdatei je Maschine
+def write_machine_timelines(instance, schedule, directory):
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for m in instance["machines"]:
+        path = os.path.join(directory, f"{instance['machine_designations'][m]}.txt")
+        with open(path, "w") as f:
+            f.write(machine_timeline(instance, schedule, m))
+        paths.append(path)
+    return paths
+
+
+# Gantt-Diagramm: je Maschine eine Zeile, je Job eine Farbe (ein Balken je Arbeitsgang von Start bis Ende)
+def gantt_figure(instance, schedule):
+    import plotly.graph_objects as go
+
+    records = schedule_records(instance, schedule)
+    machines = [instance["machine_designations"][m] for m in instance["machines"]]
+    fig = go.Figure()
+    for j in instance["jobs"]:
+        job_records = [record for record in records if record["job"] == j]
+        if not job_records:
+            continue
+        fig.add_trace(go.Bar(name=instance["job_designations"][j], orientation="h",
+                             y=[record["machine_designation"] for record in job_records],
+                             base=[record["start"] for record in job_records],
+                             x=[record["end"] - record["start"] for record in job_records],
+                             customdata=[[record["technology_designation"], record["end"]] for record in job_records],
+                             hovertemplate="%{y}<br>%{customdata[0]}<br>%{base} - %{customdata[1]}",
+                             marker_line_color="black", marker_line_width=1, width=0.4))
+    fig.update_layout(barmode="overlay", xaxis_type="linear", xaxis_title="Zeit", xaxis_showgrid=True,
+                      yaxis={"categoryorder": "array", "categoryarray": machines[::-1]})
+    return fig
+
+
+# Gantt-Diagramm als HTML (eigenständige Datei, ohne Internetzugang lesbar) oder als Bild (PNG/SVG/PDF, benötigt kaleido)
+def write_gantt(instance, schedule, path):
+    fig = gantt_figure(instance, schedule)
+    if path.endswith(".html"):
+        fig.write_html(path, include_plotlyjs=True)
+    else:
+        fig.write_image(path)
+    return path
+
+
+# Bericht in ein Verzeichnis schreiben. formats: "html"/"png" (Gantt), "csv"/"parquet" (Ablaufplan),
+# "timelines" (Belegung je Maschine). Rückgabe: geschriebene Dateien.
+def export_report(instance, schedule, directory="report", formats=("html", "csv", "timelines")):
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for file_format in formats:
+        if file_format in ("html", "png"):
+            paths.append(write_gantt(instance, schedule, os.path.join(directory, f"gantt.{file_format}")))
+        elif file_format in ("csv", "parquet"):
+            paths.append(write_schedule(instance, schedule, os.path.join(directory, f"schedule.{file_format}")))
+        elif file_format == "timelines":
+            paths += write_machine_timelines(instance, schedule, os.path.join(directory, "machines"))
+        else:
+            raise ValueError(f"Unbekanntes Berichtsformat: {file_format}")
+    return paths
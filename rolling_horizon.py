@@ -0,0 +1,130 @@
+# Rollierende Planung für lange Planungszeiträume.
+# Statt eines einzigen zeitindizierten Modells über den gesamten Zeitraum werden nacheinander überlappende
+# Zeitfenster gelöst. Jedes Fenster enthält die offenen Prozessschritte, die die Listenplanung innerhalb des Fensters
+# beginnt, und wird mit dem bestehenden Modell (assign/conflict/sequence/cmax, optimization_algorithm.solve) gelöst.
+# Festgeschrieben werden nur die Schritte, die vor dem Ende des Festschreibungsbereichs beginnen; Maschinenbelegung
+# und angefangene Jobketten werden als machine_available bzw. job_release an das nächste Fenster übergeben.
+import math
+import time
+
+import gurobipy as gp
+import tabulate
+
+from dispatching import dispatch, list_schedule, makespan, schedule_objective
+from optimization_algorithm import instance, planning_horizon, solve
+
+
+# Offene Arbeitsgänge als Instanz: je Job die noch nicht festgeschriebenen Schritte, dazu Freigabe- und
+# Verfügbarkeitszeiten aus den festgeschriebenen Schritten (absolute Zeit)
+def remaining_instance(instance, next_step, job_ready, machine_free):
+    job_process_order = {j: instance["job_process_order"][j][next_step[j]:] for j in instance["jobs"]
+                         if next_step[j] < len(instance["job_process_order"][j])}
+    remaining = dict(instance)
+    remaining["jobs"] = list(job_process_order)
+    remaining["job_process_order"] = job_process_order
+    remaining["job_release"] = {j: job_ready[j] for j in job_process_order}
+    remaining["machine_available"] = dict(machine_free)
+    return remaining
+
+
+# Teilinstanz eines Fensters. Ausgewählt wird kapazitätsbewusst: je Job die Schritte, die die Listenplanung der
+# offenen Arbeitsgänge (dispatched) vor window_end beginnt, und nicht jeder freigegebene Schritt.
+# Alle Zeiten sind relativ zu window_start (Fensterbeginn = Periode 0), damit der Horizont des Fenstermodells nur das
+# Fenster und einen begrenzten Nachlauf umfasst statt der gesamten bisher verstrichenen Zeit.
+def window_instance(remaining, dispatched, window_start, window_end):
+    selected = {}
+    for entry in dispatched:
+        if entry["start"] < window_end:
+            selected[entry["job"]] = max(selected.get(entry["job"], 0), entry["step"] + 1)
+    jobs = [j for j in remaining["jobs"] if j in selected]
+
+    sub_instance = dict(remaining)
+    sub_instance["jobs"] = jobs
+    sub_instance["job_process_order"] = {j: remaining["job_process_order"][j][:selected[j]] for j in jobs}
+    sub_instance["job_release"] = {j: max(0, remaining["job_release"][j] - window_start) for j in jobs}
+    sub_instance["machine_available"] = {m: max(0, t - window_start) for m, t in remaining["machine_available"].items()}
+    return sub_instance
+
+
+# Rollierende Planung: Fenster der Länge window_length, nach jedem Fenster wird um commit_length weitergeschoben.
+# Rückgabe: zusammengesetzter Ablaufplan und Kennzahlen je Fenster (Schritte, Horizont und Größe des Fenstermodells).
+# Der Horizont eines Fensters ist der Makespan der Listenplanung (FIFO, frühester Start) der Teilinstanz relativ zum
+# Fensterbeginn mal horizon_slack, also das Fenster plus ein begrenzter Nachlauf; solve() erweitert ihn, falls die
+# Startlösung nicht hineinpasst. Der Zuschlag ist größer als im monolithischen Modell, weil ein knapper
+# Fensterhorizont die Schritte am Fensterende auf teure Maschinen drängt.
+def solve_rolling_horizon(instance, window_length=20, commit_length=10, time_limit=10, formulation="time_indexed", horizon_slack=1.5):
+    next_step = {j: 0 for j in instance["jobs"]}
+    job_ready = {j: 0 for j in instance["jobs"]}
+    machine_free = {m: 0 for m in instance["machines"]}
+    open_steps = sum(len(steps) for steps in instance["job_process_order"].values())
+
+    schedule = []
+    windows = []
+    window_start = 0
+    while open_steps > 0:
+        remaining = remaining_instance(instance, next_step, job_ready, machine_free)
+        dispatched = list_schedule(remaining)
+        # Vor dem frühesten Start der Listenplanung kann kein offener Schritt beginnen (z. B. wenn ein Schritt
+        # länger als das Fenster ist); das Fenster wird dann dorthin verschoben
+        window_start = max(window_start, min(entry["start"] for entry in dispatched))
+        window_end = window_start + window_length
+        sub_instance = window_instance(remaining, dispatched, window_start, window_end)
+        time_period = range(max(1, math.ceil(makespan(list_schedule(sub_instance))*horizon_slack)))
+
+        start = time.perf_counter()
+        model, window_schedule = solve(sub_instance, formulation, time_period, time_limit)
+        if window_schedule is None:
+            # Keine Lösung im Zeitlimit: Ablaufplan der Prioritätsregeln für das Fenster übernehmen
+            window_schedule = dispatch(sub_instance)
+        build_and_solve = time.perf_counter() - start
+        for entry in window_schedule:
+            entry["start"] += window_start
+            entry["end"] += window_start
+
+        # Schritte festschreiben, die vor dem Ende des Festschreibungsbereichs beginnen. Beginnt keiner davor,
+        # wird das Fenster bis zum frühesten Start verschoben, damit jedes Fenster Fortschritt bringt.
+        commit_end = window_start + commit_length
+        if min(entry["start"] for entry in window_schedule) >= commit_end:
+            commit_end = min(entry["start"] for entry in window_schedule) + 1
+        committed = sorted((entry for entry in window_schedule if entry["start"] < commit_end),
+                           key=lambda entry: (entry["job"], entry["step"]))
+        step_offset = dict(next_step)
+        for entry in committed:
+            j = entry["job"]
+            entry["step"] += step_offset[j]
+            next_step[j] += 1
+            job_ready[j] = entry["end"]
+            machine_free[entry["machine"]] = max(machine_free[entry["machine"]], entry["end"])
+        schedule += committed
+        open_steps -= len(committed)
+
+        windows.append({"Fenster": len(windows), "Beginn": window_start, "Ende": window_end,
+                        "Schritte": len(window_schedule), "festgeschrieben": len(committed), "Horizont": len(time_period),
+                        "Variablen": model.NumVars, "Nebenbed.": model.NumConstrs, "Zeit [s]": build_and_solve,
+                        "Optimierung [s]": model.Runtime, "Gap": model.MIPGap if model.SolCount > 0 else None})
+        model.dispose()
+        window_start = commit_end
+
+    return schedule, windows
+
+
+# Rollierende Planung und monolithisches Modell auf derselben Instanz vergleichen
+def compare_with_monolithic(instance, window_length=20, commit_length=10, time_limit=10):
+    start = time.perf_counter()
+    schedule, windows = solve_rolling_horizon(instance, window_length, commit_length, time_limit)
+    rolling_time = time.perf_counter() - start
+    print(tabulate.tabulate([list(window.values()) for window in windows], headers=list(windows[0].keys()),
+                            tablefmt="grid", floatfmt=".3f"))
+
+    start = time.perf_counter()
+    model, monolithic_schedule = solve(instance, time_period=planning_horizon(instance), time_limit=time_limit*len(windows))
+    monolithic_time = time.perf_counter() - start
+
+    print(tabulate.tabulate([["rollierend", schedule_objective(instance, schedule), rolling_time],
+                             ["monolithisch", schedule_objective(instance, monolithic_schedule), monolithic_time]],
+                            headers=["Planung", "Ziel (Cmax + Energie + Jmax)", "Zeit [s]"], tablefmt="grid", floatfmt=".3f"))
+
+
+if __name__ == "__main__":
+    gp.setParam("OutputFlag", 0)
+    compare_with_monolithic(instance, window_length=10, commit_length=5)
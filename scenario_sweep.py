@@ -0,0 +1,87 @@
+# Mehrere Gewichtungen der Zielfunktion und/oder Instanzvarianten parallel lösen.
+# Jedes Szenario wird in einem eigenen Prozess gelöst; das Thread-Budget von Gurobi wird auf die Prozesse aufgeteilt.
+# Die Ergebnisse werden als Pareto-Tabelle (Makespan, Energie, Summe der Fertigstellungszeiten) ausgegeben.
+import concurrent.futures
+import itertools
+import os
+import time
+
+import gurobipy as gp
+import tabulate
+
+from dispatching import schedule_metrics
+from optimization_algorithm import instance, solve
+
+
+# Gewichtungen (Cmax, energy_consumed, Jmax) als Gitter. Ein kleines Mindestgewicht verhindert,
+# dass ein Kriterium ganz ohne Gewicht beliebig schlecht (und damit dominiert) ausfällt.
+def weight_grid(values=(0, 0.1, 1, 10), minimum=0.001):
+    return [tuple(max(w, minimum) for w in weights) for weights in itertools.product((1,), values, values)]
+
+
+# Ein Szenario lösen (läuft im Arbeitsprozess). Zurückgegeben werden nur picklebare Daten.
+# Ein Gurobi-Fehler (z. B. Lizenz- oder Größenbeschränkung) wird als Fehlerzeile gemeldet, statt den Lauf abzubrechen.
+def _solve_scenario(scenario, threads, time_limit):
+    gp.setParam("OutputFlag", 0)
+    start = time.perf_counter()
+    try:
+        model, schedule = solve(scenario["instance"], scenario.get("formulation", "time_indexed"), time_limit=time_limit,
+                                weights=scenario["weights"], params={"Threads": threads})
+    except gp.GurobiError as e:
+        return {"name": scenario["name"], "weights": scenario["weights"], "status": None, "gap": None,
+                "time": time.perf_counter() - start, "error": str(e)}
+    result = {"name": scenario["name"], "weights": scenario["weights"], "status": model.Status,
+              "gap": model.MIPGap if schedule is not None else None, "time": time.perf_counter() - start}
+    if schedule is not None:
+        result.update(schedule_metrics(scenario["instance"], schedule))
+        result["schedule"] = schedule
+    model.dispose()
+    return result
+
+
+# Szenarien parallel lösen. Ein Szenario ist ein dict mit "name", "instance" und "weights"
+# (optional "formulation"). threads ist das Gesamtbudget an Gurobi-Threads für alle Prozesse.
+def solve_scenarios(scenarios, workers=None, threads=None, time_limit=60):
+    threads = threads or os.cpu_count()
+    workers = max(1, min(workers or os.cpu_count(), len(scenarios)))
+    threads_per_worker = max(1, threads // workers)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_solve_scenario, scenario, threads_per_worker, time_limit) for scenario in scenarios]
+        return [future.result() for future in futures]
+
+
+# Nicht dominierte Ergebnisse je Instanzvariante bezüglich (makespan, energy, total_completion) markieren
+def mark_pareto(results, criteria=("makespan", "energy", "total_completion")):
+    for result in results:
+        if "makespan" not in result:
+            result["pareto"] = False
+            continue
+        values = [result[c] for c in criteria]
+        result["pareto"] = not any(
+            other is not result and other["name"] == result["name"] and "makespan" in other
+            and all(other[c] <= v for c, v in zip(criteria, values)) and any(other[c] < v for c, v in zip(criteria, values))
+            for other in results)
+    return results
+
+
+def print_pareto_table(results):
+    table = [[result["name"], result["weights"], result.get("makespan"), result.get("energy"), result.get("total_completion"),
+              result["gap"], result["time"], "x" if result["pareto"] else "", result.get("error", "")]
+             for result in sorted(results, key=lambda result: (result["name"], result.get("makespan", 0), result.get("energy", 0)))]
+    print(tabulate.tabulate(table, headers=["Instanz", "Gewichte (Cmax, Energie, Jmax)", "Makespan", "Energie",
+                                            "Summe Fertigstellung", "Gap", "Zeit [s]", "Pareto", "Fehler"],
+                            tablefmt="grid", floatfmt=".3f"))
+
+
+if __name__ == "__main__":
+    # Varianten der Maschinenzuordnung wie in den auskommentierten Alternativen der Beispieldaten
+    reduced = dict(instance)
+    reduced["technology_allocation"] = {0: [0, 1], 1: [2, 3], 2: [2, 4]}
+    variants = {"Beispiel": instance, "reduzierte Zuordnung": reduced}
+
+    scenarios = [{"name": name, "instance": variant, "weights": weights}
+                 for name, variant in variants.items() for weights in weight_grid()]
+    start = time.perf_counter()
+    results = mark_pareto(solve_scenarios(scenarios, time_limit=30))
+    print_pareto_table(results)
+    print(f"{len(scenarios)} Szenarien in {time.perf_counter() - start:.1f} s")
@@ -0,0 +1,215 @@
+# Zeitindiziertes Modell: Zeitfenster der Arbeitsgänge (Eignungstabelle), Index der Startvariablen x[j, m, step, t],
+# Modellaufbau mit quicksum-Schleifen und Auslesen des Ablaufplans. Gemeinsame Grundlage für optimization_algorithm.py,
+# den Matrix-Aufbau (matrix_model.py), das disjunktive Modell und die inkrementelle Umplanung.
+import gurobipy as gp
+from gurobipy import GRB
+import numpy as np
+
+from instance_io import operation_array
+
+
+# Eignungstabelle der Arbeitsgänge als flache NumPy-Arrays.
+# Je Arbeitsgang i (sortiert nach Job und Schritt): job, step, technology, duration (Dauer * Stückzahl),
+# earliest (frühester Start) und latest (Horizont minus Dauer des Arbeitsgangs und aller Nachfolger).
+# Je geeignetem Paar k aus Arbeitsgang und Maschine: pair_operation, pair_machine und pair_earliest
+# (zusätzlich frühestens ab instance["machine_available"][m]). Paare ohne zulässigen Start entfallen.
+# propagate=True: earliest wird vorab (wie ein Presolve) über die Maschinenfolge propagiert, siehe propagate_windows;
+# sonst nur Kopf der Kette (Freigabe plus Dauer aller Vorgänger).
+def operation_table(instance, time_period, propagate=True):
+    job_quantity = instance["job_quantity"]
+    job_release = instance.get("job_release", {})
+    machine_available = instance.get("machine_available", {})
+
+    operations = operation_array(instance)
+    # Position des Jobs in instance["jobs"] je Arbeitsgang (operation_array ist nach dieser Reihenfolge sortiert)
+    counts = [len(instance["job_process_order"][j]) for j in instance["jobs"]]
+    job_position = np.repeat(np.arange(len(counts)), counts)
+    quantity = np.array([job_quantity[j] for j in instance["jobs"]], dtype=np.int64)
+    release = np.array([job_release.get(j, 0) for j in instance["jobs"]], dtype=np.int64)
+    duration = operations["duration"].astype(np.int64)*quantity[job_position]
+
+    # Kopf und Schwanz der Kette über kumulierte Summen je Job
+    cumulative = np.cumsum(duration)
+    first = np.searchsorted(job_position, job_position, side="left")
+    last = np.searchsorted(job_position, job_position, side="right") - 1
+    head = cumulative - duration - (cumulative[first] - duration[first])
+    tail = cumulative[last] - cumulative + duration
+    table = {"job": operations["job"].astype(np.int64), "step": operations["step"].astype(np.int64), "technology": operations["technology"].astype(np.int64),
+             "duration": duration, "earliest": release[job_position] + head, "latest": len(time_period) - tail}
+    table["has_prev"] = table["step"] > 0
+    if propagate:
+        propagate_windows(instance, table)
+
+    # Geeignete Maschinen je Technologie, vektorisiert über alle Arbeitsgänge dieser Technologie
+    pair_operation, pair_machine, pair_earliest = [], [], []
+    for tech, allocated in instance["technology_allocation"].items():
+        ops = np.flatnonzero(table["technology"] == tech)
+        for m in allocated:
+            earliest = np.maximum(table["earliest"][ops], machine_available.get(m, 0))
+            feasible = earliest <= table["latest"][ops]
+            pair_operation.append(ops[feasible])
+            pair_machine.append(np.full(int(feasible.sum()), m, dtype=np.int64))
+            pair_earliest.append(earliest[feasible])
+    pair_operation = np.concatenate(pair_operation or [np.zeros(0, dtype=np.int64)])
+    # Nach Arbeitsgang sortiert, damit die Variablen eines Arbeitsgangs zusammenhängend angelegt werden
+    order = np.argsort(pair_operation, kind="stable")
+    table["pair_operation"] = pair_operation[order]
+    table["pair_machine"] = np.concatenate(pair_machine or [np.zeros(0, dtype=np.int64)])[order]
+    table["pair_earliest"] = np.concatenate(pair_earliest or [np.zeros(0, dtype=np.int64)])[order]
+    return table
+
+
+# Zeitfenster der Arbeitsgänge vor dem Modellaufbau verengen (in table, siehe operation_table).
+# Ein Arbeitsgang kann erst beginnen, wenn eine seiner Maschinen verfügbar ist (frühestes machine_available
+# unter den Maschinen seiner Technologie), und erst nach dem frühesten Ende seines Vorgängers.
+# Beides wird Schritt für Schritt entlang der Ketten aller Jobs gleichzeitig vorwärts propagiert.
+# Die späteste Startzeit (Horizont minus Schwanz der Kette) hängt nicht von den Maschinen ab und bleibt unverändert.
+def propagate_windows(instance, table):
+    machine_available = instance.get("machine_available", {})
+    technology_ready = {tech: min(machine_available.get(m, 0) for m in allocated)
+                        for tech, allocated in instance["technology_allocation"].items()}
+    ready = np.array([technology_ready.get(tech, 0) for tech in table["technology"].tolist()], dtype=np.int64)
+    earliest, duration, step = table["earliest"], table["duration"], table["step"]
+    for level in range(int(step.max(initial=-1)) + 1):
+        ops = np.flatnonzero(step == level)
+        if level > 0:
+            # Der Vorgänger steht in der Tabelle direkt davor
+            earliest[ops] = np.maximum(earliest[ops], earliest[ops - 1] + duration[ops - 1])
+        earliest[ops] = np.maximum(earliest[ops], ready[ops])
+
+
+# Wirkung der Zeitfenster auf die Modellgröße: Startvariablen und Einträge in conflict-Zeilen
+#   ohne Zeitfenster (jede Periode des Horizonts), nur Kopf/Schwanz der Kette, nach propagate_windows
+def window_statistics(instance, time_period):
+    table = operation_table(instance, time_period, propagate=False)
+    statistics = {"ohne Zeitfenster": (len(table["pair_operation"])*len(time_period),
+                                       int(table["duration"][table["pair_operation"]].sum())*len(time_period))}
+    for name, propagate in (("Kette", False), ("propagiert", True)):
+        table = operation_table(instance, time_period, propagate)
+        length = np.maximum(table["latest"][table["pair_operation"]] - table["pair_earliest"] + 1, 0)
+        statistics[name] = (int(length.sum()), int((length*table["duration"][table["pair_operation"]]).sum()))
+    return statistics
+
+
+# Dünn besetzter Index der zulässigen Startvariablen (j, m, step, t) aus der Eignungstabelle.
+# Eine Variable wird nur angelegt, wenn die Maschine m die Technologie des Arbeitsgangs (j, step) beherrscht
+# und t im Zeitfenster des Arbeitsgangs liegt (siehe operation_table).
+def build_start_index(instance, time_period):
+    table = operation_table(instance, time_period)
+    job, step, latest = table["job"].tolist(), table["step"].tolist(), table["latest"].tolist()
+    start_index = gp.tuplelist()
+    for i, m, earliest in zip(table["pair_operation"].tolist(), table["pair_machine"].tolist(), table["pair_earliest"].tolist()):
+        for t in range(earliest, latest[i] + 1):
+            start_index.append((job[i], m, step[i], t))
+    return start_index
+
+
+# Zeitindiziertes Modell mit quicksum-Schleifen aufbauen.
+# Gibt das Modell, die Startvariablen x[j, m, step, t] und den zugehörigen Index zurück.
+def build_model(instance, time_period, weights=(1, 1, 1)):
+    jobs = instance["jobs"]
+    machine_energy_consumption = instance["machine_energy_consumption"]
+    technology_allocation = instance["technology_allocation"]
+    job_process_order = instance["job_process_order"]
+    job_quantity = instance["job_quantity"]
+
+    # Initialisiere das Modell
+    model = gp.Model("JobScheduling")
+
+    # # Setze PoolSearchMode auf 2, um mehrere Lösungen zu finden
+    # model.setParam(GRB.Param.PoolSearchMode, 2)
+
+    # # Setze die maximale Anzahl von Lösungen, die im Pool gespeichert werden sollen
+    # model.setParam(GRB.Param.PoolSolutions, 10)
+
+    start_index = build_start_index(instance, time_period)
+
+    # Variablen: Startzeiten x_ij (nur für zulässige Tupel)
+    x = model.addVars(start_index, vtype=GRB.BINARY, name="x")
+
+    # Cmax Variable (für makespan)
+    Cmax = model.addVar(vtype=GRB.INTEGER, name="Cmax")
+    # penalty = model.addVar(vtype=GRB.INTEGER, name="penalty")
+
+    # (1) Jeder Job startet nur einmal auf einer Maschine
+    for j in jobs:
+        for step in range(len(job_process_order[j])):
+            # model.addConstr((gp.quicksum(x[j, m, tech, t] for m in technology_allocation[tech] for t in time_period) >= job_quantity[j]), name=f"assign_{j}_{tech}")
+            model.addConstr((x.sum(j, "*", step, "*") == 1), name=f"assign_{j}_{step}")
+
+    # (2) Maschine kann zur gleichen Zeit nur einen Job bearbeiten
+    # Jede Startvariable belegt die Maschine für die Dauer ihres Schrittes. Statt für jedes (m, t)
+    # alle Jobs abzusuchen, wird jede Variable einmal in die Perioden eingetragen, die sie belegt.
+    conflict_terms = {}
+    for j, m, step, t_prime in start_index:
+        duration = job_process_order[j][step][1]*job_quantity[j]
+        for t in range(t_prime, t_prime + duration):
+            conflict_terms.setdefault((m, t), []).append((j, m, step, t_prime))
+
+    for (m, t), terms in conflict_terms.items():
+        # Perioden, in denen nur Starts eines einzigen Arbeitsgangs die Maschine belegen, brauchen keine
+        # Nebenbedingung: assign lässt davon ohnehin höchstens einen zu
+        if len({(j, step) for j, _, step, _ in terms}) > 1:
+            model.addConstr(gp.quicksum(x[key] for key in terms) <= 1, name=f"conflict_{m}_{t}")
+
+    # (3) Maschinenfolge der Jobs einhalten
+    for j in jobs:
+        # Iteriere über die Arbeitsgänge in der Reihenfolge ihrer Bearbeitung
+        process_steps = job_process_order[j]
+
+        for idx in range(1, len(process_steps)):
+            # Dauer des vorherigen Arbeitsgangs
+            duration_prev = process_steps[idx - 1][1]
+
+            model.addConstr(
+                        (
+                            gp.quicksum((t + (duration_prev*job_quantity[j])) * x[j, m_prev, idx - 1, t]  for _, m_prev, _, t in start_index.select(j, "*", idx - 1, "*"))
+                            <= gp.quicksum(t * x[j, m_curr, idx, t]  for _, m_curr, _, t in start_index.select(j, "*", idx, "*"))
+                        ),
+                        name=f"Sequence. Job: {j}; step_jetzt:{idx}"
+                    )
+
+    # (7) Bearbeitungsdauer soll min. so lang sein wie der letzte Prozessschritt mit der längsten Prozessdauer
+    # Nur für Cmax relevant
+    for j in jobs:
+        for step, (tech, duration) in enumerate(job_process_order[j]):
+            for m in technology_allocation[tech]:
+                starts = start_index.select(j, m, step, "*")
+                if starts:
+                    model.addConstr(
+                        (gp.quicksum((t + (duration*job_quantity[j])) * x[j, m, step, t] for _, _, _, t in starts)) <= Cmax,
+                        name=f"cmax_{j}_{step}_{m}"
+                    )
+
+    # Wenn Summe über alles gebildet wird, dann werden die Jobs so schnell wie möglich erledigt, aber die Gesamtdauer alle Jobs zu erledigen steigt.
+    Jmax = gp.quicksum((t + (job_process_order[j][step][1]*job_quantity[j])) * x[j, m, step, t] for j, m, step, t in start_index)
+
+    energy_consumed = gp.quicksum(x[j, m, step, t]*machine_energy_consumption[m] for j, m, step, t in start_index)
+
+    # model.setObjective(Cmax, GRB.MINIMIZE)
+    # model.setObjective(Cmax + energy_consumed, GRB.MINIMIZE)
+    # model.setObjective(energy_consumed, GRB.MINIMIZE)
+    # model.setObjective(Cmax + energy_consumed + Jmax, GRB.MINIMIZE)
+    model.setObjective(weights[0]*Cmax + weights[1]*energy_consumed + weights[2]*Jmax, GRB.MINIMIZE)
+
+    return model, x, start_index
+
+
+# Ablaufplan (Format aus dispatching.py) aus den Startvariablen x[j, m, step, t] lesen.
+# Alle Lösungswerte werden mit einem einzigen getAttr-Aufruf gelesen statt x[...].X je Variable,
+# die aktiven Starts liefert ein vektorisierter Vergleich.
+def extract_schedule(model, instance, x):
+    job_process_order = instance["job_process_order"]
+    job_quantity = instance["job_quantity"]
+
+    keys = list(x.keys())
+    values = np.array(model.getAttr("X", list(x.values())))
+
+    schedule = []
+    for i in np.flatnonzero(values > 0.5):
+        j, m, step, t = keys[i]
+        tech, duration = job_process_order[j][step]
+        duration = duration*job_quantity[j]
+        schedule.append({"job": j, "step": step, "technology": tech, "machine": m,
+                         "start": t, "end": t + duration})
+    return schedule